@@ -5,10 +5,15 @@ Routes commands to appropriate service scripts in services/ directory.
 Usage:
     ./service.py quality lint
     ./service.py dev install-dev
+
+Service scripts run in this interpreter; set QUALITY_FORCE_SUBPROCESS=1
+to run them in a child process instead.
 """
 
 from __future__ import annotations
 
+import importlib.util
+import os
 import sys
 from pathlib import Path
 
@@ -16,6 +21,40 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 SERVICES_DIR = PROJECT_ROOT / "services"
 
 
+def _run_subprocess(script_path: Path, command_args: list[str]) -> int:
+    """Run a service script in a child interpreter."""
+    import subprocess
+
+    result = subprocess.run(
+        [sys.executable, str(script_path)] + command_args,
+        cwd=PROJECT_ROOT,
+    )
+    return result.returncode
+
+
+def _run_in_process(script_path: Path, command_args: list[str]) -> int:
+    """Load a service script as a module and call its main() directly.
+
+    Mirrors what the child process would see: argv, working directory and
+    the `sys.exit(main())` contract.
+    """
+    spec = importlib.util.spec_from_file_location(f"_service_{script_path.stem}", script_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load service script: {script_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    sys.argv = [str(script_path), *command_args]
+    os.chdir(PROJECT_ROOT)
+    try:
+        spec.loader.exec_module(module)
+        return int(module.main() or 0)
+    except SystemExit as exc:
+        if exc.code is None or isinstance(exc.code, int):
+            return exc.code or 0
+        print(exc.code, file=sys.stderr)
+        return 1
+
+
 def main() -> int:
     """Main entry point."""
     if len(sys.argv) < 2:
@@ -53,25 +92,20 @@ def main() -> int:
         "template": SERVICES_DIR / "template.py",
     }
 
-    if service not in service_scripts:
+    script_path = service_scripts.get(service)
+    if script_path is None:
         print(f"Error: Unknown service '{service}'")
-        print("Available services: quality, dev, django, publish, cli, template")
+        print(f"Available services: {', '.join(service_scripts)}")
         return 1
-
-    script_path = service_scripts[service]
-
     if not script_path.exists():
         print(f"Error: Service script not found: {script_path}")
         return 1
 
     # Execute the service script with remaining arguments
-    import subprocess
     try:
-        result = subprocess.run(
-            [sys.executable, str(script_path)] + command_args,
-            cwd=PROJECT_ROOT,
-        )
-        return result.returncode
+        if os.environ.get("QUALITY_FORCE_SUBPROCESS") == "1":
+            return _run_subprocess(script_path, command_args)
+        return _run_in_process(script_path, command_args)
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
         return 130
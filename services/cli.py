@@ -51,7 +51,7 @@ def main() -> int:
     project_root = Path(__file__).resolve().parent.parent
     src_path = project_root / "src"
 
-    if src_path.exists():
+    if src_path.exists() and str(src_path) not in sys.path:
         sys.path.insert(0, str(src_path))
 
     # Find package name dynamically
@@ -8,6 +8,10 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
 
 
 def _load_modules() -> tuple:
@@ -45,7 +49,8 @@ task_update_lib = lib.task_update_lib
 task_update_additional_libs = lib.task_update_additional_libs
 
 
-COMMANDS = {
+# Every task takes the arguments that follow the command name
+COMMANDS: dict[str, Callable[[Sequence[str]], bool]] = {
     "help": task_help,
     "venv": task_venv,
     "install": task_install,
@@ -75,7 +80,7 @@ def main(argv: list[str] | None = None) -> int:
         print_info("Run `python dev.py help` to list available commands.")
         return 1
 
-    return utils.run_service_command(COMMANDS[command])
+    return utils.run_service_command(COMMANDS[command], args[1:])
 
 
 if __name__ == "__main__":
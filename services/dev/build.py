@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from services import utils
 
 from .env import install_build_dependencies
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 VENV_BIN = utils.VENV_BIN
 PYTHON = utils.PYTHON
 
@@ -17,7 +22,7 @@ venv_exists = utils.venv_exists
 run_command = utils.run_command
 
 
-def task_build() -> bool:
+def task_build(_args: Sequence[str] = ()) -> bool:
     """Build sdist and wheel."""
     if not venv_exists():
         print_error("Virtual environment not found. Run `python dev.py install-dev` first.")
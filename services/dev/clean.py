@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import shutil
+from typing import TYPE_CHECKING
 
 from services import utils
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 PROJECT_ROOT = utils.PROJECT_ROOT
 
 # Import utility functions
@@ -13,7 +17,7 @@ print_info = utils.print_info
 print_success = utils.print_success
 
 
-def task_clean_build() -> bool:
+def task_clean_build(_args: Sequence[str] = ()) -> bool:
     """Remove build artifacts."""
     print_info("Removing build artifacts...")
     for directory in ["build", "dist", ".eggs"]:
@@ -29,7 +33,7 @@ def task_clean_build() -> bool:
     return True
 
 
-def task_clean_pyc() -> bool:
+def task_clean_pyc(_args: Sequence[str] = ()) -> bool:
     """Remove Python bytecode artifacts."""
     print_info("Removing Python bytecode artifacts...")
 
@@ -44,7 +48,7 @@ def task_clean_pyc() -> bool:
     return True
 
 
-def task_clean_test() -> bool:
+def task_clean_test(_args: Sequence[str] = ()) -> bool:
     """Remove test artifacts."""
     print_info("Removing test artifacts...")
     artifacts = [".pytest_cache", ".coverage", "htmlcov", ".mypy_cache", ".ruff_cache"]
@@ -62,7 +66,7 @@ def task_clean_test() -> bool:
     return True
 
 
-def task_clean() -> bool:
+def task_clean(_args: Sequence[str] = ()) -> bool:
     """Remove all build, bytecode, and test artifacts."""
     task_clean_build()
     task_clean_pyc()
@@ -10,6 +10,8 @@ from services import utils
 
 # Export common constants
 PROJECT_ROOT = utils.PROJECT_ROOT
+IS_WINDOWS = utils.IS_WINDOWS
+EXE = utils.EXE
 VENV_BIN = utils.VENV_BIN
 VENV_DIR = utils.VENV_DIR
 PIP = utils.PIP
@@ -21,4 +23,11 @@ print_error = utils.print_error
 print_warning = utils.print_warning
 venv_exists = utils.venv_exists
 run_command = utils.run_command
+fast_rmtree = utils.fast_rmtree
+getenv = utils.getenv
+pip_env = utils.pip_env
+pip_no_compile_args = utils.pip_no_compile_args
+pip_editable_args = utils.pip_editable_args
+fast_editable = utils.fast_editable
+build_requirements = utils.build_requirements
 
@@ -3,21 +3,25 @@
 
 from __future__ import annotations
 
-import platform
+import argparse
+import hashlib
+import os
 import shutil
+import threading
 from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 # Use common imports from dev.common
 from services.dev import common
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 # Import from common
 # pylint: disable=R0801  # Duplicate code acceptable for common imports
 PROJECT_ROOT = common.PROJECT_ROOT
 VENV_BIN = common.VENV_BIN
 VENV_DIR = common.VENV_DIR
+IS_WINDOWS = common.IS_WINDOWS
 PIP = common.PIP
 print_info = common.print_info
 print_success = common.print_success
@@ -25,125 +29,269 @@ print_error = common.print_error
 print_warning = common.print_warning
 venv_exists = common.venv_exists
 run_command = common.run_command
+fast_rmtree = common.fast_rmtree
+getenv = common.getenv
+pip_env = common.pip_env
+pip_no_compile_args = common.pip_no_compile_args
+pip_editable_args = common.pip_editable_args
+fast_editable = common.fast_editable
+build_requirements = common.build_requirements
+
+DEV_EXTRAS = "lint,security,test,quality"
+
+# Lives inside the venv, so recreating the environment also invalidates it
+REQUIREMENTS_MARKER = VENV_DIR / ".requirements_hash"
+PACKAGE_METADATA_FILES = ("pyproject.toml", "setup.cfg", "setup.py")
+
+
+def install_build_dependencies(upgrade_pip: bool = True) -> bool:
+    """Install build dependencies.
+
+    With FAST_EDITABLE=1 the project's own build backend is installed too,
+    since editable installs then build without isolation.
+
+    Args:
+        upgrade_pip: Also upgrade pip and setuptools; pass False right after
+            `venv --upgrade-deps` already did
+    """
+    packages = ["pip", "setuptools", "wheel"] if upgrade_pip else ["wheel"]
+    if fast_editable():
+        packages += build_requirements([PROJECT_ROOT])
+    success, _ = run_command(
+        [str(PIP), "install", "--upgrade", *dict.fromkeys(packages)],
+        env=pip_env(),
+    )
+    return success
 
 
-def install_build_dependencies() -> bool:
-    """Install build dependencies."""
-    success, _ = run_command([str(PIP), "install", "--upgrade", "pip", "setuptools", "wheel"])
-    return success
+def _venv_create_command() -> list[str]:
+    """Build the command used to create the virtual environment.
 
+    Prefers `virtualenv --symlink-app-data`, which reuses cached seed wheels
+    instead of reinstalling pip into every new environment. Falls back to
+    the stdlib venv module when virtualenv is unavailable or FAST_VENV=0.
+    """
+    virtualenv = shutil.which("virtualenv")
+    if virtualenv and not IS_WINDOWS and getenv("FAST_VENV") != "0":
+        return [virtualenv, "--symlink-app-data", "--download=false", str(VENV_DIR)]
 
-def task_venv() -> bool:
-    """Create a virtual environment."""
-    if venv_exists():
-        print_warning("Virtual environment already exists.")
-        return True
+    # --upgrade-deps upgrades pip and setuptools while seeding the environment
+    python_cmd = "python" if IS_WINDOWS else "python3"
+    return [python_cmd, "-m", "venv", "--upgrade-deps", str(VENV_DIR)]
+
+
+def _create_venv() -> tuple[bool, bool]:
+    """Create the virtual environment.
 
-    python_cmd = "python3" if platform.system() != "Windows" else "python"
+    Returns:
+        Tuple of (success, whether pip and setuptools were upgraded on creation)
+    """
     print_info("Creating virtual environment...")
-    success, _ = run_command([python_cmd, "-m", "venv", str(VENV_DIR)], check=False)
+    cmd = _venv_create_command()
+    success, _ = run_command(cmd, check=False)
+    venv_exists.cache_clear()
     if not success:
-        return False
+        return (False, False)
 
     print_success(f"Virtual environment created at {VENV_DIR}")
     activation = (
         f"{VENV_DIR}\\Scripts\\activate"
-        if platform.system() == "Windows"
+        if IS_WINDOWS
         else f"source {VENV_DIR}/bin/activate"
     )
     print_info(f"Activate it with: {activation}")
-    return True
+    return (True, "--upgrade-deps" in cmd)
+
+
+def task_venv(_args: Sequence[str] = ()) -> bool:
+    """Create a virtual environment."""
+    if venv_exists():
+        print_warning("Virtual environment already exists.")
+        return True
+
+    success, _ = _create_venv()
+    return success
+
+
+def _ensure_venv() -> tuple[bool, bool]:
+    """Create the virtual environment if it is missing.
+
+    Returns:
+        Tuple of (success, whether pip and setuptools are freshly upgraded)
+    """
+    if venv_exists():
+        return (True, False)
+    return _create_venv()
+
+
+def _remove_venv_dir() -> threading.Thread | None:
+    """Remove the virtual environment directory.
+
+    The directory is renamed aside and deleted in a background thread so the
+    new environment can be created immediately. Falls back to a synchronous
+    delete when the rename fails.
 
+    Returns:
+        The background deletion thread, or None if the delete was synchronous
+    """
+    trash = VENV_DIR.with_name(f"{VENV_DIR.name}.old-{os.getpid()}")
+    try:
+        VENV_DIR.rename(trash)
+    except OSError:
+        fast_rmtree(VENV_DIR)
+        return None
 
-def task_venv_clean() -> bool:
+    # Non-daemon so the interpreter waits for the delete to finish on exit
+    worker = threading.Thread(target=fast_rmtree, args=(trash,))
+    worker.start()
+    return worker
+
+
+def task_venv_clean(_args: Sequence[str] = ()) -> bool:
     """Recreate the virtual environment."""
+    worker = None
     if venv_exists():
         print_info("Removing existing virtual environment...")
-        shutil.rmtree(VENV_DIR, ignore_errors=True)
+        worker = _remove_venv_dir()
+        venv_exists.cache_clear()
         print_success("Virtual environment removed.")
-    return task_venv()
 
+    success = task_venv()
+    if worker is not None:
+        worker.join()
+    return success
 
-def task_install() -> bool:
+
+def task_install(_args: Sequence[str] = ()) -> bool:
     """Install the package in production mode."""
-    if not venv_exists() and not task_venv():
+    venv_ok, deps_upgraded = _ensure_venv()
+    if not venv_ok:
         return False
 
     print_info("Installing package (production)...")
-    if not install_build_dependencies():
+    if not install_build_dependencies(upgrade_pip=not deps_upgraded):
         return False
 
-    success, _ = run_command([str(PIP), "install", "."], check=False)
+    # The package and requirements.txt (if any) are resolved in one pip invocation
+    cmd = [str(PIP), "install", "."]
+    requirements = PROJECT_ROOT / "requirements.txt"
+    if requirements.is_file():
+        print_info("Including dependencies from requirements.txt...")
+        cmd += ["-r", str(requirements)]
+    success, _ = run_command(cmd, check=False, env=pip_env())
     if not success:
         return False
 
-    # Install requirements.txt if it exists
-    requirements = PROJECT_ROOT / "requirements.txt"
-    if requirements.exists():
-        print_info("Installing dependencies from requirements.txt...")
-        run_command([str(PIP), "install", "-r", str(requirements)], check=False)
-
     print_success("Installation complete.")
     return True
 
 
-def _install_requirements_file(req_path: Path) -> None:
-    """Install dependencies from a requirements file if it exists."""
-    if req_path.exists():
-        print_info(f"Installing dependencies from {req_path.name}...")
-        run_command([str(PIP), "install", "-r", str(req_path)], check=False)
-
-
-def _install_dev_dependencies_from_file() -> bool:
-    """Install development dependencies from requirements-quality.txt if it exists."""
-    requirements_quality = PROJECT_ROOT / "requirements-quality.txt"
-    if not requirements_quality.exists():
-        return False
-
-    print_info("Installing development dependencies from requirements-quality.txt...")
-    success, _ = run_command([str(PIP), "install", "-r", str(requirements_quality)], check=False)
-    return success
-
-
-def _install_dev_dependencies_fallback() -> None:
-    """Install development dependencies using fallback methods."""
-    print_info("Installing development dependencies from pyproject.toml...")
-    deps = ["lint", "security", "test", "quality"]
-    for dep_group in deps:
-        success, _ = run_command([str(PIP), "install", "-e", f".[{dep_group}]"], check=False)
+def _requirements_files() -> list[str]:
+    """List the requirements*.txt files in the project root, sorted by name."""
+    with os.scandir(PROJECT_ROOT) as entries:
+        return sorted(
+            entry.name
+            for entry in entries
+            if entry.name.startswith("requirements") and entry.name.endswith(".txt") and entry.is_file()
+        )
+
+
+def _dev_install_command(requirements: Sequence[str]) -> list[str]:
+    """Build a single pip command installing the package and all dev dependencies.
+
+    Extras and every requirements*.txt file are resolved in one pip
+    invocation instead of paying resolver startup once per group/file.
+    """
+    cmd = [str(PIP), "install", *pip_editable_args(), "-e", f".[{DEV_EXTRAS}]"]
+    for req_file in requirements:
+        cmd += ["-r", str(PROJECT_ROOT / req_file)]
+    return cmd
+
+
+def _install_dev_groups_individually(requirements: Sequence[str]) -> bool:
+    """Install each extra and requirements file separately after a failed combined install.
+
+    Slower than the combined command, but points at the group that breaks.
+    """
+    groups = [["-e", f".[{extra}]"] for extra in DEV_EXTRAS.split(",")]
+    groups += [["-r", str(PROJECT_ROOT / req_file)] for req_file in requirements]
+
+    failed = []
+    for group in groups:
+        pip_args = pip_editable_args() if group[0] == "-e" else pip_no_compile_args()
+        success, _ = run_command(
+            [str(PIP), "install", *pip_args, *group],
+            check=False,
+            env=pip_env(),
+        )
         if not success:
-            print_warning(f"Failed to install {dep_group} dependencies")
+            failed.append(group[1])
+
+    for group_name in failed:
+        print_warning(f"Failed to install {group_name}")
+    return not failed
+
+
+def _requirements_fingerprint(cmd: Sequence[str], requirements: Sequence[str]) -> str:
+    """Hash the install command and every file that declares dependencies."""
+    digest = hashlib.sha256("\0".join(cmd).encode())
+    for name in (*PACKAGE_METADATA_FILES, *requirements):
+        path = PROJECT_ROOT / name
+        if path.is_file():
+            digest.update(f"\0{name}\0".encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _parse_install_dev_args(args: Sequence[str]) -> argparse.Namespace:
+    """Parse install-dev arguments."""
+    parser = argparse.ArgumentParser(prog="dev.py install-dev")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reinstall even if the dependencies have not changed",
+    )
+    return parser.parse_args(list(args))
+
 
-    requirements_files = [
-        "requirements-quality.txt",
-        "requirements-django.txt",
-    ]
-    for req_file in requirements_files:
-        _install_requirements_file(PROJECT_ROOT / req_file)
+def task_install_dev(args: Sequence[str] = ()) -> bool:
+    """Install the package in editable mode with dev dependencies.
 
+    The installation is skipped when pyproject.toml and the requirements
+    files are unchanged since the last successful run; pass --force to
+    reinstall anyway.
 
-def task_install_dev() -> bool:
-    """Install the package in editable mode with dev dependencies."""
-    if not venv_exists() and not task_venv():
+    Args:
+        args: Command arguments (--force)
+    """
+    options = _parse_install_dev_args(args)
+    venv_ok, deps_upgraded = _ensure_venv()
+    if not venv_ok:
         return False
 
+    requirements = _requirements_files()
+    cmd = _dev_install_command(requirements)
+    fingerprint = _requirements_fingerprint(cmd, requirements)
+    if not options.force:
+        try:
+            if REQUIREMENTS_MARKER.read_text(encoding="utf-8") == fingerprint:
+                print_success("Development dependencies are up to date (use --force to reinstall).")
+                return True
+        except OSError:
+            pass
+
     print_info("Installing package (development)...")
-    if not install_build_dependencies():
+    if not install_build_dependencies(upgrade_pip=not deps_upgraded):
         return False
 
-    success, _ = run_command([str(PIP), "install", "-e", "."], check=False)
+    success, _ = run_command(cmd, check=False, env=pip_env())
+    if not success:
+        print_warning("Combined installation failed, retrying one dependency group at a time...")
+        success = _install_dev_groups_individually(requirements)
     if not success:
+        REQUIREMENTS_MARKER.unlink(missing_ok=True)
         return False
 
-    _install_requirements_file(PROJECT_ROOT / "requirements.txt")
-
-    if _install_dev_dependencies_from_file():
-            print_success("Development installation complete.")
-            return True
-
-    print_warning("Failed to install from requirements-quality.txt, trying fallback methods...")
-    _install_dev_dependencies_fallback()
-
+    REQUIREMENTS_MARKER.write_text(fingerprint, encoding="utf-8")
     print_success("Development installation complete.")
     return True
-
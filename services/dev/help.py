@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from services import utils
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 # Import utility functions
 print_info = utils.print_info
 print_success = utils.print_success
 
 
-def task_help() -> bool:
+def task_help(_args: Sequence[str] = ()) -> bool:
     """Display help message."""
     print_info("Python Project — available commands\n")
 
@@ -17,6 +22,7 @@ def task_help() -> bool:
     print("  venv              Create a local virtual environment")
     print("  install           Install the package in production mode")
     print("  install-dev       Install the package in editable mode with dev dependencies")
+    print("                    Usage: dev install-dev [--force]")
     print("  venv-clean        Recreate the virtual environment")
     print("")
 
@@ -35,7 +41,7 @@ def task_help() -> bool:
     print("  update-lib            Install or update a library from local directory (editable mode)")
     print("                        Usage: dev update-lib path/to/library")
     print("  update-additional-libs  Install or update libraries from additionallib.json")
-    print("                        Usage: dev update-additional-libs")
+    print("                        Usage: dev update-additional-libs [--sequential | --parallel N]")
     print("")
 
     print_success("Usage: python dev.py <command>")
@@ -3,13 +3,29 @@
 
 from __future__ import annotations
 
+import argparse
 import json
-import sys
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from services import utils
 from services.dev import common
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    # (name, target directory, install without dependencies)
+    PendingLibrary = tuple[str, Path, bool]
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads  # type: ignore[assignment]
+
 # Import from common
 # pylint: disable=R0801  # Duplicate code acceptable for common imports
 PROJECT_ROOT = common.PROJECT_ROOT
@@ -20,12 +36,26 @@ print_error = common.print_error
 print_warning = common.print_warning
 venv_exists = common.venv_exists
 run_command = common.run_command
+pip_env = common.pip_env
+pip_editable_args = common.pip_editable_args
+fast_editable = common.fast_editable
+build_requirements = common.build_requirements
+getenv = common.getenv
 
 # Import additional utils not in common
-print_separator = utils.print_separator
+OutputBuffer = utils.OutputBuffer
+
+DEFAULT_PARALLEL = 4
 
 
-def task_update_lib() -> bool:
+def _parse_update_lib_args(args: Sequence[str]) -> argparse.Namespace:
+    """Parse update-lib arguments."""
+    parser = argparse.ArgumentParser(prog="dev.py update-lib")
+    parser.add_argument("path", nargs="?", help="Path to the library directory")
+    return parser.parse_args(list(args))
+
+
+def task_update_lib(args: Sequence[str] = ()) -> bool:
     """Install or update a library from local directory in editable mode.
 
     Usage:
@@ -36,26 +66,22 @@ def task_update_lib() -> bool:
     immediately available without reinstalling.
 
     Args:
-        Path to the library directory (must contain setup.py or pyproject.toml)
+        args: Command arguments; the first one is the path to the library
+            directory (must contain setup.py or pyproject.toml)
     """
     if not venv_exists():
         print_error("Virtual environment not found. Run 'python dev.py venv' first.")
         return False
 
-    # Get path from command line arguments
-    args = sys.argv[2:] if len(sys.argv) > 2 else []
-
-    if not args:
+    lib_path = _parse_update_lib_args(args).path
+    if not lib_path:
         print_error("No library path provided.")
         print_info("Usage: python dev.py update-lib <path_to_library>")
         print_info("       ./service.py dev update-lib path/to/lib")
         return False
 
-    target_dir = Path(args[0]).resolve()
-
-    # Handle relative paths
-    if not target_dir.is_absolute():
-        target_dir = (PROJECT_ROOT / args[0]).resolve()
+    # Relative paths are taken from the project root
+    target_dir = Path(os.path.realpath(os.path.join(PROJECT_ROOT, lib_path)))
 
     if not target_dir.exists():
         print_error(f"Library directory not found at {target_dir}")
@@ -80,7 +106,14 @@ def task_update_lib() -> bool:
     print_info(f"Installing {lib_name} into the virtual environment...")
     print_info(f"Library path: {target_dir}")
 
-    success, _ = run_command([str(PIP), "install", "-e", str(target_dir)], check=False)
+    if not _install_build_backends([target_dir]):
+        return False
+
+    success, _ = run_command(
+        [str(PIP), "install", *pip_editable_args(), "-e", str(target_dir)],
+        check=False,
+        env=pip_env(),
+    )
     if success:
         print_success(f"{lib_name} installed/updated successfully.")
         return True
@@ -89,6 +122,25 @@ def task_update_lib() -> bool:
     return False
 
 
+def _install_build_backends(target_dirs: Sequence[Path]) -> bool:
+    """Install the targets' build backends once, for FAST_EDITABLE=1 builds without isolation."""
+    if not fast_editable():
+        return True
+    requires = build_requirements(target_dirs)
+    print_info(f"Installing build backends: {', '.join(requires)}")
+    success, _ = run_command([str(PIP), "install", *requires], check=False, env=pip_env())
+    if not success:
+        print_error("Failed to install build backends.")
+    return success
+
+
+@lru_cache(maxsize=4)
+def _parse_config_file(config_file: Path, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON config file; the stat fields key the cache so edits invalidate it."""
+    del mtime_ns, size
+    return json_loads(config_file.read_bytes())
+
+
 def _load_libraries_config(config_file: Path) -> list[dict] | None:
     """Load and validate libraries configuration from JSON file."""
     if not config_file.exists():
@@ -97,14 +149,15 @@ def _load_libraries_config(config_file: Path) -> list[dict] | None:
         print_info("You can copy additionallib.json.example as a template.")
         return None
 
-    print_separator()
-    print_info(f"Reading libraries from {config_file.name}")
-    print_separator()
+    with OutputBuffer() as out:
+        out.separator()
+        out.info(f"Reading libraries from {config_file.name}")
+        out.separator()
 
     try:
-        with open(config_file, encoding="utf-8") as f:
-            config = json.load(f)
-    except json.JSONDecodeError as e:
+        file_stat = config_file.stat()
+        config = _parse_config_file(config_file, file_stat.st_mtime_ns, file_stat.st_size)
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
         print_error(f"Invalid JSON in {config_file}: {e}")
         return None
     except Exception as e:
@@ -123,7 +176,7 @@ def _load_libraries_config(config_file: Path) -> list[dict] | None:
     return libraries
 
 
-def _validate_library_config(lib_config: dict, idx: int) -> tuple[str, str, str] | None:
+def _validate_library_config(lib_config: dict, idx: int) -> tuple[str, str, str, bool] | None:
     """Validate and extract library configuration."""
     if not isinstance(lib_config, dict):
         print_warning(f"Library entry {idx} is not a dictionary, skipping")
@@ -132,35 +185,53 @@ def _validate_library_config(lib_config: dict, idx: int) -> tuple[str, str, str]
     lib_name = lib_config.get("name", f"library-{idx}")
     lib_path = lib_config.get("path")
     lib_description = lib_config.get("description", "")
+    no_deps = bool(lib_config.get("no_deps", False)) or getenv("ADDITIONAL_LIBS_NO_DEPS") == "1"
 
     if not lib_path:
         print_error(f"Library '{lib_name}' missing 'path' field, skipping")
         return None
 
-    return lib_name, lib_path, lib_description
+    return lib_name, lib_path, lib_description, no_deps
 
 
 def _resolve_library_path(lib_path: str) -> Path | None:
     """Resolve library path and validate it exists."""
+    if not os.path.isabs(lib_path):
+        lib_path = os.path.realpath(os.path.join(PROJECT_ROOT, lib_path))
     target_dir = Path(lib_path)
-    if not target_dir.is_absolute():
-        target_dir = (PROJECT_ROOT / lib_path).resolve()
 
-    if not target_dir.exists():
+    # One stat answers both "exists" and "is a directory"
+    try:
+        mode = target_dir.stat().st_mode
+    except OSError:
         print_warning(f"  ⚠ Library directory not found at {target_dir}, skipping")
         return None
 
-    if not target_dir.is_dir():
+    if not stat.S_ISDIR(mode):
         print_warning(f"  ⚠ Path is not a directory: {target_dir}, skipping")
         return None
 
     return target_dir
 
 
-def _install_library(lib_name: str, target_dir: Path) -> bool:
+def _library_install_command(target_dirs: Sequence[Path], no_deps: bool = False) -> list[str]:
+    """Build the editable pip install command for one or more libraries."""
+    cmd = [str(PIP), "install", *pip_editable_args()]
+    if no_deps:
+        cmd.append("--no-deps")
+    for target_dir in target_dirs:
+        cmd += ["-e", str(target_dir)]
+    return cmd
+
+
+def _install_library(lib_name: str, target_dir: Path, no_deps: bool = False) -> bool:
     """Install a single library in editable mode."""
     print_info(f"  Installing {lib_name}...")
-    success, _ = run_command([str(PIP), "install", "-e", str(target_dir)], check=False)
+    success, _ = run_command(
+        _library_install_command([target_dir], no_deps),
+        check=False,
+        env=pip_env(),
+    )
 
     if success:
         print_success(f"  ✓ {lib_name} installed/updated successfully")
@@ -171,55 +242,191 @@ def _install_library(lib_name: str, target_dir: Path) -> bool:
     return success
 
 
-def _process_library(lib_config: dict, idx: int, total: int) -> tuple[str, bool]:
-    """Process a single library installation."""
+def _prepare_library(lib_config: dict, idx: int, total: int) -> tuple[str, Path | None, bool]:
+    """Validate a library entry and resolve its target directory."""
     validated = _validate_library_config(lib_config, idx)
     if validated is None:
-        return f"library-{idx}", False
+        return f"library-{idx}", None, False
+
+    lib_name, lib_path, lib_description, no_deps = validated
+
+    with OutputBuffer() as out:
+        out.info(f"[{idx}/{total}] Processing {lib_name}")
+        if lib_description:
+            out.info(f"  Description: {lib_description}")
+        out.info(f"  Path: {lib_path}")
+        if no_deps:
+            out.info("  Dependencies: not installed (no_deps)")
+
+    return lib_name, _resolve_library_path(lib_path), no_deps
+
+
+def _install_libraries_parallel(pending: list[PendingLibrary], workers: int) -> dict[str, bool]:
+    """Install libraries concurrently, one pip process per library."""
+    print_info(f"Installing {len(pending)} library(ies) with {workers} parallel worker(s)...")
+    results: dict[str, bool] = {}
+    with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+        futures = {
+            executor.submit(
+                run_command,
+                _library_install_command([target_dir], no_deps),
+                check=False,
+                env=pip_env(),
+                prefix=f"  [{lib_name}] ",
+            ): lib_name
+            for lib_name, target_dir, no_deps in pending
+        }
+        for future in as_completed(futures):
+            lib_name = futures[future]
+            success, _ = future.result()
+            if success:
+                print_success(f"  ✓ {lib_name} installed/updated successfully")
+            else:
+                print_error(f"  ✗ Failed to install/update {lib_name}")
+            results[lib_name] = success
+    print()
+
+    # Concurrent pip runs can race on a shared dependency; retry failures one at a time
+    retry = [entry for entry in pending if not results[entry[0]]]
+    if retry:
+        print_info(f"Retrying {len(retry)} failed library(ies) sequentially...")
+        for lib_name, target_dir, no_deps in retry:
+            results[lib_name] = _install_library(lib_name, target_dir, no_deps)
+    return results
 
-    lib_name, lib_path, lib_description = validated
 
-    print_info(f"[{idx}/{total}] Processing {lib_name}")
-    if lib_description:
-        print_info(f"  Description: {lib_description}")
-    print_info(f"  Path: {lib_path}")
+def _install_libraries_batch(pending: list[PendingLibrary]) -> dict[str, bool]:
+    """Install libraries with one pip invocation per `--no-deps` setting.
 
-    target_dir = _resolve_library_path(lib_path)
-    if target_dir is None:
-        return lib_name, False
+    pip resolves every editable target in one pass, so shared dependencies
+    are only resolved once. pip aborts the whole batch on any error, so a
+    failed batch is retried library by library to find which ones fail.
+    """
+    results: dict[str, bool] = {}
+    for no_deps in (False, True):
+        batch = [entry for entry in pending if entry[2] is no_deps]
+        if batch:
+            results.update(_install_batch(batch, no_deps))
+    return results
 
-    success = _install_library(lib_name, target_dir)
-    return lib_name, success
+
+def _install_batch(batch: list[PendingLibrary], no_deps: bool) -> dict[str, bool]:
+    """Install libraries sharing the same `--no-deps` setting in a single pip call."""
+    cmd = _library_install_command([target_dir for _, target_dir, _ in batch], no_deps)
+
+    print_info(f"Installing {len(batch)} library(ies) in a single pip invocation...")
+    success, _ = run_command(cmd, check=False, env=pip_env())
+    if success:
+        print_success("  ✓ All libraries installed/updated successfully")
+        print()
+        return {lib_name: True for lib_name, _, _ in batch}
+
+    print_error("  ✗ Batched installation failed")
+    if len(batch) == 1:
+        print()
+        return {batch[0][0]: False}
+
+    print_info("Falling back to sequential installation...")
+    print()
+    return {
+        lib_name: _install_library(lib_name, target_dir, no_deps)
+        for lib_name, target_dir, no_deps in batch
+    }
+
+
+def _parse_additional_libs_args(args: Sequence[str]) -> argparse.Namespace:
+    """Parse update-additional-libs arguments."""
+    parser = argparse.ArgumentParser(prog="dev.py update-additional-libs")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Install libraries one by one",
+    )
+    mode.add_argument(
+        "--parallel",
+        type=int,
+        nargs="?",
+        const=DEFAULT_PARALLEL,
+        metavar="N",
+        help=f"Install with N concurrent pip processes (default {DEFAULT_PARALLEL}, 0 disables)",
+    )
+    return parser.parse_args(list(args))
+
+
+def _install_pending(
+    pending: list[PendingLibrary],
+    options: argparse.Namespace,
+) -> dict[str, bool]:
+    """Install resolved libraries using the mode selected on the command line."""
+    if not pending:
+        return {}
+
+    if options.sequential:
+        workers = 1
+    elif options.parallel is not None:
+        workers = options.parallel
+    else:
+        return _install_libraries_batch(pending)
+
+    if workers > 1 and len(pending) > 1:
+        return _install_libraries_parallel(pending, workers)
+
+    return {
+        lib_name: _install_library(lib_name, target_dir, no_deps)
+        for lib_name, target_dir, no_deps in pending
+    }
+
+
+def _check_dependencies() -> None:
+    """Run `pip check` once after --no-deps installs to report unmet requirements."""
+    print_info("Checking installed dependencies (pip check)...")
+    success, _ = run_command([str(PIP), "check"], check=False, env=pip_env())
+    if success:
+        print_success("  ✓ All requirements are satisfied")
+    else:
+        print_warning("  ⚠ Some requirements are missing; drop no_deps for the affected libraries")
+    print()
 
 
 def _print_installation_summary(results: dict[str, bool]) -> None:
     """Print installation summary."""
-    print_separator()
-    print_info("Installation Summary")
-    print_separator()
-
     total = len(results)
     successful = sum(1 for success in results.values() if success)
     failed = total - successful
 
-    for lib_name, success in results.items():
-        status = f"{utils.GREEN}✓{utils.NC}" if success else f"{utils.RED}✗{utils.NC}"
-        print(f"  {status} {lib_name}")
+    ok_mark = f"{utils.GREEN}✓{utils.NC}"
+    fail_mark = f"{utils.RED}✗{utils.NC}"
+    with OutputBuffer() as out:
+        out.separator()
+        out.info("Installation Summary")
+        out.separator()
+        for lib_name, success in results.items():
+            out.line(f"  {ok_mark if success else fail_mark} {lib_name}")
+        out.separator()
+        out.info(f"Total: {total} | Successful: {successful} | Failed: {failed}")
+        out.separator()
 
-    print_separator()
-    print_info(f"Total: {total} | Successful: {successful} | Failed: {failed}")
-    print_separator()
 
-
-def task_update_additional_libs() -> bool:
+def task_update_additional_libs(args: Sequence[str] = ()) -> bool:
     """Install or update libraries listed in additionallib.json.
 
     Usage:
-      python dev.py update-additional-libs
-      ./service.py dev update-additional-libs
+      python dev.py update-additional-libs [--sequential | --parallel N]
+      ./service.py dev update-additional-libs [--sequential | --parallel N]
 
     Reads the additionallib.json file in the project root and installs
-    all libraries listed there in editable mode.
+    all libraries listed there in editable mode. By default every library
+    is installed in a single pip invocation (falling back to one install
+    per library if the batch fails); --sequential installs them
+    one by one for easier debugging, and --parallel N runs up to N
+    concurrent pip processes (N defaults to 4, 0 or 1 is sequential);
+    libraries that fail in parallel mode are retried one at a time.
+
+    Entries with `"no_deps": true` (or every entry, with
+    ADDITIONAL_LIBS_NO_DEPS=1) are installed with --no-deps, skipping
+    dependency resolution for sibling libraries whose requirements are
+    already in the venv; a single `pip check` then reports anything missing.
 
     The JSON file should have the following structure:
     {
@@ -227,11 +434,16 @@ def task_update_additional_libs() -> bool:
         {
           "name": "library-name",
           "path": "../path/to/library",
-          "description": "Optional description"
+          "description": "Optional description",
+          "no_deps": false
         }
       ]
     }
+
+    Args:
+        args: Command arguments (--sequential or --parallel N)
     """
+    options = _parse_additional_libs_args(args)
     if not venv_exists():
         print_error("Virtual environment not found. Run 'python dev.py venv' first.")
         return False
@@ -247,10 +459,25 @@ def task_update_additional_libs() -> bool:
 
     print_info(f"Found {len(libraries)} library(ies) to install/update\n")
 
-    results = {}
+    names = []
+    pending: list[PendingLibrary] = []
+    outcomes: dict[str, bool] = {}
     for idx, lib_config in enumerate(libraries, 1):
-        lib_name, success = _process_library(lib_config, idx, len(libraries))
-        results[lib_name] = success
+        lib_name, target_dir, no_deps = _prepare_library(lib_config, idx, len(libraries))
+        names.append(lib_name)
+        if target_dir is None:
+            outcomes[lib_name] = False
+        else:
+            pending.append((lib_name, target_dir, no_deps))
+
+    if pending and not _install_build_backends([target_dir for _, target_dir, _ in pending]):
+        return False
+
+    outcomes.update(_install_pending(pending, options))
+    if any(no_deps and outcomes[lib_name] for lib_name, _, no_deps in pending):
+        _check_dependencies()
+
+    results = {lib_name: outcomes[lib_name] for lib_name in names}
 
     _print_installation_summary(results)
     failed = len(results) - sum(1 for success in results.values() if success)
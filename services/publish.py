@@ -20,7 +20,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Sequence
 
 
 _services_dir = Path(__file__).resolve().parent
@@ -74,7 +74,12 @@ def task_help() -> bool:
     print("  upload-testpypi      Upload package to TestPyPI")
     print("  upload-pypi          Upload package to PyPI")
     print("  github-release       Create a GitHub release")
-    print("  release-full         Full release workflow (tag, build, upload, GitHub)")
+    print("  release-full         Full release workflow (tag + push, build, upload, GitHub)")
+    print("")
+    print("  upload-testpypi, upload-pypi and release-full reuse the installed twine;")
+    print("  pass --force-twine-upgrade to upgrade it first.")
+    print("  git-tag, upload-pypi and release-full accept --yes (or DEV_ASSUME_YES=1) to skip")
+    print("  confirmations; without a terminal, prompts take their default (no).")
     print("")
     print_success("Social Media Publishing:")
     print("  twitter              Publish to X (Twitter)")
@@ -101,8 +106,8 @@ def task_help() -> bool:
     return True
 
 
-# Command mapping
-COMMANDS: dict[str, Callable[[], bool]] = {
+# Command mapping; tasks take the keyword options listed in COMMAND_OPTIONS
+COMMANDS: dict[str, Callable[..., bool]] = {
     "help": task_help,
     # Release commands
     "show-info": task_show_info,
@@ -122,21 +127,53 @@ COMMANDS: dict[str, Callable[[], bool]] = {
     "social-all": task_publish_all,
 }
 
+# Flags accepted per command, mapped to the task keyword argument they set
+COMMAND_OPTIONS: dict[str, dict[str, str]] = {
+    "git-tag": {"--yes": "assume_yes"},
+    "upload-testpypi": {"--force-twine-upgrade": "force_twine_upgrade"},
+    "upload-pypi": {"--yes": "assume_yes", "--force-twine-upgrade": "force_twine_upgrade"},
+    "release-full": {"--yes": "assume_yes", "--force-twine-upgrade": "force_twine_upgrade"},
+}
+
+
+def _parse_options(command: str, flags: Sequence[str]) -> dict[str, bool] | None:
+    """Turn command-line flags into keyword arguments for a command's task.
+
+    Returns:
+        Keyword arguments, or None if a flag is not accepted by the command
+    """
+    accepted = COMMAND_OPTIONS.get(command, {})
+    options: dict[str, bool] = {}
+    for flag in flags:
+        if flag not in accepted:
+            print_error(f"Unknown option for {command}: {flag}")
+            return None
+        options[accepted[flag]] = True
+    return options
 
-def main() -> int:
+
+def main(argv: Sequence[str] | None = None) -> int:
     """Main entry point."""
-    if len(sys.argv) < 2:
+    args = list(sys.argv[1:] if argv is None else argv)
+    flags = [arg for arg in args if arg.startswith("--")]
+    positional = [arg for arg in args if not arg.startswith("--")]
+
+    if not positional:
         task_help()
         return 0
 
-    command = sys.argv[1].lower()
+    command = positional[0].lower()
 
     if command not in COMMANDS:
         print_error(f"Unknown command: {command}")
         print_info("Run 'python publish.py help' to see available commands")
         return 1
 
-    return utils.run_service_command(COMMANDS[command])
+    options = _parse_options(command, flags)
+    if options is None:
+        return 1
+
+    return utils.run_service_command(COMMANDS[command], **options)
 
 
 if __name__ == "__main__":
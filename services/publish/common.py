@@ -10,6 +10,8 @@ from services import utils
 
 # Export common constants
 PROJECT_ROOT = utils.PROJECT_ROOT
+IS_WINDOWS = utils.IS_WINDOWS
+EXE = utils.EXE
 
 # Export common utility functions
 print_info = utils.print_info
@@ -18,4 +20,6 @@ print_error = utils.print_error
 print_warning = utils.print_warning
 print_header = utils.print_header
 print_separator = utils.print_separator
+venv_tool = utils.venv_tool
+getenv = utils.getenv
 
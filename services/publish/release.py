@@ -3,8 +3,9 @@
 
 from __future__ import annotations
 
-import platform
+import os
 import subprocess
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from services import utils
@@ -13,6 +14,14 @@ from services.dev.build import task_build
 if TYPE_CHECKING:
     from pathlib import Path
 
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None  # type: ignore[assignment]
+
 # Use common imports from publish.common
 from services.publish import common
 
@@ -27,13 +36,28 @@ print_header = common.print_header
 print_separator = common.print_separator
 
 # Import additional utils not in common
-VENV_BIN = utils.VENV_BIN
 PYTHON = utils.PYTHON
 PIP = utils.PIP
 venv_exists = utils.venv_exists
 run_command = utils.run_command
+confirm = utils.confirm
+
+TWINE = common.venv_tool("twine")
+
+# Parsed pyproject.toml info keyed by (path, mtime)
+_pyproject_cache: dict[tuple[Path, float], dict[str, Any]] = {}
 
+# Whether a git tag exists, keyed by tag name
+_git_tag_exists_cache: dict[str, bool] = {}
 
+
+def clear_pyproject_cache() -> None:
+    """Clear cached pyproject.toml information."""
+    _pyproject_cache.clear()
+    find_pyproject_toml.cache_clear()
+
+
+@lru_cache(maxsize=1)
 def find_pyproject_toml() -> Path | None:
     """Find pyproject.toml file in project root.
 
@@ -55,13 +79,14 @@ def _check_is_django(dependencies: list[str]) -> bool:
     return "django" in deps_str
 
 
-def _parse_project_info_with_tomli(pyproject_path: Path) -> dict[str, Any] | None:
-    """Parse project info using tomli library."""
-    try:
-        import tomli
+def _parse_project_info_with_tomllib(pyproject_path: Path) -> dict[str, Any] | None:
+    """Parse project info using tomllib (or tomli on Python < 3.11)."""
+    if tomllib is None:
+        return None
 
+    try:
         with open(pyproject_path, "rb") as f:
-            data = tomli.load(f)
+            data = tomllib.load(f)
 
         project_data = data.get("project", {})
         dependencies = project_data.get("dependencies", [])
@@ -73,15 +98,13 @@ def _parse_project_info_with_tomli(pyproject_path: Path) -> dict[str, Any] | Non
             "is_django": _check_is_django(dependencies),
             "has_src_layout": (PROJECT_ROOT / "src").exists() and (PROJECT_ROOT / "src").is_dir(),
         }
-    except ImportError:
-        return None
     except Exception as e:
-        print_error(f"Error reading pyproject.toml with tomli: {e}")
+        print_error(f"Error reading pyproject.toml: {e}")
         return None
 
 
 def _parse_project_info_fallback(pyproject_path: Path) -> dict[str, Any] | None:
-    """Fallback parsing without tomli."""
+    """Fallback parsing when neither tomllib nor tomli is available."""
     try:
         with open(pyproject_path, encoding="utf-8") as f:
             content = f.read()
@@ -122,11 +145,19 @@ def get_project_info() -> dict[str, Any] | None:
     if not pyproject_path:
         return None
 
-    result = _parse_project_info_with_tomli(pyproject_path)
-    if result is not None:
-        return result
+    key = (pyproject_path, pyproject_path.stat().st_mtime)
+    cached = _pyproject_cache.get(key)
+    if cached is not None:
+        return cached
 
-    return _parse_project_info_fallback(pyproject_path)
+    if tomllib is not None:
+        result = _parse_project_info_with_tomllib(pyproject_path)
+    else:
+        result = _parse_project_info_fallback(pyproject_path)
+
+    if result is not None:
+        _pyproject_cache[key] = result
+    return result
 
 
 def get_project_version() -> str | None:
@@ -155,6 +186,20 @@ def detect_project_type() -> str:
         return "library"  # Default to library if not Django
 
 
+def _git(*args: str) -> subprocess.CompletedProcess[str]:
+    """Run a read-only git query in the project root.
+
+    GIT_OPTIONAL_LOCKS=0 keeps status-like queries from taking the index lock.
+    """
+    return subprocess.run(
+        ["git", *args],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"},
+    )
+
+
 def get_git_tag(version: str | None = None) -> str | None:
     """Get or create git tag for version."""
     if not version:
@@ -166,13 +211,10 @@ def get_git_tag(version: str | None = None) -> str | None:
     tag = f"v{version}"
 
     # Check if tag already exists
-    result = subprocess.run(
-        ["git", "tag", "-l", tag],
-        capture_output=True,
-        text=True,
-        cwd=PROJECT_ROOT,
-    )
-    if result.returncode == 0 and result.stdout.strip():
+    if tag not in _git_tag_exists_cache:
+        result = _git("for-each-ref", f"refs/tags/{tag}", "--format=%(refname)")
+        _git_tag_exists_cache[tag] = result.returncode == 0 and bool(result.stdout.strip())
+    if _git_tag_exists_cache[tag]:
         print_warning(f"Tag {tag} already exists")
         return tag
 
@@ -205,8 +247,13 @@ def task_show_info() -> bool:
     return True
 
 
-def task_git_tag() -> bool:
-    """Create a Git tag for the current version."""
+def task_git_tag_and_push(push: bool = True, assume_yes: bool = False) -> bool:
+    """Create a Git tag for the current version and optionally push it.
+
+    Args:
+        push: Push the new tag to origin right after creating it
+        assume_yes: Tag a dirty working directory without asking
+    """
     version = get_project_version()
     if not version:
         print_error("Could not determine version from pyproject.toml")
@@ -227,16 +274,10 @@ def task_git_tag() -> bool:
     print_info(f"Creating Git tag: {tag}")
 
     # Check if we're on a clean working directory
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True,
-        text=True,
-        cwd=PROJECT_ROOT,
-    )
+    result = _git("status", "--porcelain")
     if result.stdout.strip():
         print_warning("Working directory is not clean. Uncommitted changes detected.")
-        response = input("Continue anyway? (y/N): ")
-        if response.lower() != "y":
+        if not confirm("Continue anyway? (y/N): ", yes=assume_yes):
             return False
 
     # Create tag
@@ -247,9 +288,27 @@ def task_git_tag() -> bool:
     if not success:
         return False
 
+    _git_tag_exists_cache[tag] = True
     print_success(f"Tag {tag} created successfully")
-    print_info("Push tags with: git push --tags")
-    return True
+
+    if not push:
+        print_info("Push tags with: git push --tags")
+        return True
+
+    print_info(f"Pushing tag {tag} to origin...")
+    success, _ = run_command(["git", "push", "origin", f"refs/tags/{tag}"], check=False)
+    if success:
+        print_success(f"Tag {tag} pushed successfully")
+    return success
+
+
+def task_git_tag(assume_yes: bool = False) -> bool:
+    """Create a Git tag for the current version.
+
+    Args:
+        assume_yes: Tag a dirty working directory without asking
+    """
+    return task_git_tag_and_push(push=False, assume_yes=assume_yes)
 
 
 def task_git_push_tags() -> bool:
@@ -261,23 +320,54 @@ def task_git_push_tags() -> bool:
     return success
 
 
-def task_upload_testpypi() -> bool:
-    """Upload package to TestPyPI."""
+def _ensure_twine(force_upgrade: bool = False) -> bool:
+    """Make sure twine is available, installing or upgrading it only when needed.
+
+    Args:
+        force_upgrade: Upgrade twine even if a working copy is installed
+    """
+    if not force_upgrade and TWINE.exists():
+        try:
+            probe = subprocess.run(
+                [str(TWINE), "--version"],
+                capture_output=True,
+                text=True,
+                timeout=15,
+            )
+            if probe.returncode == 0:
+                return True
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+
+    success, _ = run_command(
+        [str(PIP), "install", "--upgrade", "twine"],
+        check=False,
+        env=utils.pip_env(),
+    )
+    return success
+
+
+def task_upload_testpypi(skip_build: bool = False, force_twine_upgrade: bool = False) -> bool:
+    """Upload package to TestPyPI.
+
+    Args:
+        skip_build: Reuse existing dist/ artifacts instead of rebuilding
+        force_twine_upgrade: Upgrade twine before uploading
+    """
     if not venv_exists():
         print_error("Virtual environment not found. Run 'python dev.py venv' first.")
         return False
 
-    if not task_build():
+    if not skip_build and not task_build():
         return False
 
     print_info("Uploading to TestPyPI...")
 
-    if not run_command([str(PIP), "install", "--upgrade", "twine"], check=False):
+    if not _ensure_twine(force_twine_upgrade):
         return False
 
-    twine = VENV_BIN / ("twine.exe" if platform.system() == "Windows" else "twine")
     success, _ = run_command(
-        [str(twine), "upload", "--repository", "testpypi", "dist/*"],
+        [str(TWINE), "upload", "--repository", "testpypi", "dist/*"],
         check=False,
     )
 
@@ -291,13 +381,23 @@ def task_upload_testpypi() -> bool:
     return success
 
 
-def task_upload_pypi() -> bool:
-    """Upload package to PyPI."""
+def task_upload_pypi(
+    skip_build: bool = False,
+    assume_yes: bool = False,
+    force_twine_upgrade: bool = False,
+) -> bool:
+    """Upload package to PyPI.
+
+    Args:
+        skip_build: Reuse existing dist/ artifacts instead of rebuilding
+        assume_yes: Upload without asking for confirmation
+        force_twine_upgrade: Upgrade twine before uploading
+    """
     if not venv_exists():
         print_error("Virtual environment not found. Run 'python dev.py venv' first.")
         return False
 
-    if not task_build():
+    if not skip_build and not task_build():
         return False
 
     print_warning("WARNING: This will upload to PyPI!")
@@ -305,15 +405,16 @@ def task_upload_pypi() -> bool:
     print_warning("  1. Updated version in pyproject.toml")
     print_warning("  2. Updated CHANGELOG.md")
     print_warning("  3. Run all tests and quality checks")
-    input("Press Enter to continue, or Ctrl+C to cancel... ")
+    if not confirm("Continue with upload? (y/N): ", yes=assume_yes):
+        print_info("Upload cancelled.")
+        return False
 
     print_info("Uploading to PyPI...")
 
-    if not run_command([str(PIP), "install", "--upgrade", "twine"], check=False):
+    if not _ensure_twine(force_twine_upgrade):
         return False
 
-    twine = VENV_BIN / ("twine.exe" if platform.system() == "Windows" else "twine")
-    success, _ = run_command([str(twine), "upload", "dist/*"], check=False)
+    success, _ = run_command([str(TWINE), "upload", "dist/*"], check=False)
 
     if success:
         print_success("Upload to PyPI complete!")
@@ -337,23 +438,26 @@ def _read_release_notes(version: str, tag: str) -> str:
     if not changelog_path.exists():
         return f"Release {version}"
 
+    headers = (f"## {version}", f"## {tag}")
+    captured: list[str] = []
     try:
         with open(changelog_path, encoding="utf-8") as f:
-            content = f.read()
-
-        start = content.find(f"## {version}") or content.find(f"## {tag}")
-        if start == -1:
-            return f"Release {version}"
-
-        end = content.find("## ", start + 1)
-        if end == -1:
-            return content[start:].strip()
-
-        return content[start:end].strip()
+            for line in f:
+                if captured:
+                    if line.startswith("## "):
+                        break
+                    captured.append(line)
+                elif line.startswith(headers):
+                    captured.append(line)
     except Exception as e:
         print_warning(f"Could not read CHANGELOG.md: {e}")
         return f"Release {version}"
 
+    if not captured:
+        return f"Release {version}"
+
+    return "".join(captured).strip()
+
 
 def task_github_release() -> bool:
     """Create a GitHub release."""
@@ -380,8 +484,13 @@ def task_github_release() -> bool:
     return success
 
 
-def task_full_release() -> bool:
-    """Full release workflow: tag, build, upload, and create GitHub release."""
+def task_full_release(assume_yes: bool = False, force_twine_upgrade: bool = False) -> bool:
+    """Full release workflow: tag, build, upload, and create GitHub release.
+
+    Args:
+        assume_yes: Answer yes to every confirmation, including the GitHub release
+        force_twine_upgrade: Upgrade twine before uploading
+    """
     print_separator()
     print_header("FULL RELEASE WORKFLOW")
     print_separator()
@@ -395,10 +504,10 @@ def task_full_release() -> bool:
 
     # Step 1: Create Git tag
     print("\n" + "-" * 70)
-    print_info("Step 1/4: Creating Git tag")
+    print_info("Step 1/4: Creating and pushing Git tag")
     print("-" * 70)
-    if not task_git_tag():
-        print_error("Failed to create Git tag")
+    if not task_git_tag_and_push(assume_yes=assume_yes):
+        print_error("Failed to create or push Git tag")
         return False
 
     # Step 2: Build package
@@ -413,7 +522,9 @@ def task_full_release() -> bool:
     print("\n" + "-" * 70)
     print_info("Step 3/4: Uploading to PyPI")
     print("-" * 70)
-    if not task_upload_pypi():
+    if not task_upload_pypi(
+        skip_build=True, assume_yes=assume_yes, force_twine_upgrade=force_twine_upgrade
+    ):
         print_error("Upload to PyPI failed")
         return False
 
@@ -421,8 +532,7 @@ def task_full_release() -> bool:
     print("\n" + "-" * 70)
     print_info("Step 4/4: Creating GitHub release (optional)")
     print("-" * 70)
-    response = input("Create GitHub release? (y/N): ")
-    if response.lower() == "y":
+    if confirm("Create GitHub release? (y/N): ", yes=assume_yes):
         task_github_release()
 
     print_separator()
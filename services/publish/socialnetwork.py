@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import json
-import os
 import subprocess
 import sys
 from pathlib import Path
@@ -38,6 +37,7 @@ print_error = common.print_error
 print_warning = common.print_warning
 print_header = common.print_header
 print_separator = common.print_separator
+getenv = common.getenv
 
 
 def format_release_message(version: str | None = None, changelog: str = "") -> str:
@@ -65,11 +65,11 @@ def task_twitter(message: str | None = None) -> bool:
     print_info("Publishing to X (Twitter)...")
 
     # Check for Twitter API credentials
-    api_key = os.environ.get("TWITTER_API_KEY")
-    api_secret = os.environ.get("TWITTER_API_SECRET")
-    access_token = os.environ.get("TWITTER_ACCESS_TOKEN")
-    access_token_secret = os.environ.get("TWITTER_ACCESS_TOKEN_SECRET")
-    bearer_token = os.environ.get("TWITTER_BEARER_TOKEN")
+    api_key = getenv("TWITTER_API_KEY")
+    api_secret = getenv("TWITTER_API_SECRET")
+    access_token = getenv("TWITTER_ACCESS_TOKEN")
+    access_token_secret = getenv("TWITTER_ACCESS_TOKEN_SECRET")
+    bearer_token = getenv("TWITTER_BEARER_TOKEN")
 
     if not bearer_token and not all([api_key, api_secret, access_token, access_token_secret]):
         print_error("Twitter API credentials not found in environment variables")
@@ -112,7 +112,7 @@ def task_devto(message: str | None = None, title: str | None = None) -> bool:
     """Publish release announcement to dev.to."""
     print_info("Publishing to dev.to...")
 
-    api_key = os.environ.get("DEVTO_API_KEY")
+    api_key = getenv("DEVTO_API_KEY")
     if not api_key:
         print_error("DEVTO_API_KEY not found in environment variables")
         print_info("Get your API key from: https://dev.to/settings/extensions")
@@ -165,7 +165,7 @@ def task_linkedin(message: str | None = None) -> bool:
     """Publish release announcement to LinkedIn."""
     print_info("Publishing to LinkedIn...")
 
-    access_token = os.environ.get("LINKEDIN_ACCESS_TOKEN")
+    access_token = getenv("LINKEDIN_ACCESS_TOKEN")
     if not access_token:
         print_error("LINKEDIN_ACCESS_TOKEN not found in environment variables")
         print_info("See: https://www.linkedin.com/developers/apps")
@@ -185,7 +185,7 @@ def task_linkedin(message: str | None = None) -> bool:
     }
 
     # Get person URN (simplified - in production, you'd want to fetch this)
-    person_urn = os.environ.get("LINKEDIN_PERSON_URN", "urn:li:person:YOUR_PERSON_ID")
+    person_urn = getenv("LINKEDIN_PERSON_URN", "urn:li:person:YOUR_PERSON_ID")
 
     data = {
         "author": person_urn,
@@ -216,8 +216,8 @@ def task_mastodon(message: str | None = None) -> bool:
     """Publish release announcement to Mastodon."""
     print_info("Publishing to Mastodon...")
 
-    instance_url = os.environ.get("MASTODON_INSTANCE_URL")
-    access_token = os.environ.get("MASTODON_ACCESS_TOKEN")
+    instance_url = getenv("MASTODON_INSTANCE_URL")
+    access_token = getenv("MASTODON_ACCESS_TOKEN")
 
     if not instance_url or not access_token:
         print_error("MASTODON_INSTANCE_URL and MASTODON_ACCESS_TOKEN required")
@@ -297,11 +297,11 @@ def task_reddit(message: str | None = None, subreddit: str | None = None) -> boo
     """Publish release announcement to Reddit."""
     print_info("Publishing to Reddit...")
 
-    client_id = os.environ.get("REDDIT_CLIENT_ID")
-    client_secret = os.environ.get("REDDIT_CLIENT_SECRET")
-    username = os.environ.get("REDDIT_USERNAME")
-    password = os.environ.get("REDDIT_PASSWORD")
-    user_agent = os.environ.get("REDDIT_USER_AGENT", f"{PROJECT_ROOT.name}/1.0")
+    client_id = getenv("REDDIT_CLIENT_ID")
+    client_secret = getenv("REDDIT_CLIENT_SECRET")
+    username = getenv("REDDIT_USERNAME")
+    password = getenv("REDDIT_PASSWORD")
+    user_agent = getenv("REDDIT_USER_AGENT", f"{PROJECT_ROOT.name}/1.0")
 
     if not all([client_id, client_secret, username, password]):
         print_error("Reddit API credentials not found in environment variables")
@@ -310,7 +310,7 @@ def task_reddit(message: str | None = None, subreddit: str | None = None) -> boo
         return False
 
     if not subreddit:
-        subreddit = os.environ.get("REDDIT_SUBREDDIT")
+        subreddit = getenv("REDDIT_SUBREDDIT")
         if not subreddit:
             print_error("Subreddit not specified. Set REDDIT_SUBREDDIT or use --subreddit option")
             return False
@@ -6,8 +6,13 @@ Provides commands for linting, security checks, and testing.
 
 from __future__ import annotations
 
+import importlib
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 def _load_modules() -> tuple:
@@ -18,24 +23,40 @@ def _load_modules() -> tuple:
         sys.path.insert(0, str(_project_root))
 
     from services import utils
-    from services.quality import cleanup, complexity, lint, security, test
 
-    return utils, cleanup, complexity, lint, security, test
+    return utils
 
 
-utils, cleanup, complexity, lint, security, test = _load_modules()
+utils = _load_modules()
 
 # Import utility functions for error handling
 print_error = utils.print_error
 print_info = utils.print_info
 print_success = utils.print_success
 
-# Import task functions from modules
-task_lint = lint.task_lint
-task_security = security.task_security
-task_test = test.task_test
-task_complexity = complexity.task_complexity
-task_cleanup = cleanup.task_cleanup
+# Task modules are imported on demand, so a single command only loads its own
+TASKS: dict[str, tuple[str, str]] = {
+    "lint": ("lint", "task_lint"),
+    "security": ("security", "task_security"),
+    "test": ("test", "task_test"),
+    "complexity": ("complexity", "task_complexity"),
+    "cleanup": ("cleanup", "task_cleanup"),
+    "pylint-daemon": ("lint", "task_pylint_daemon"),
+    "semgrep-rules": ("semgrep", "task_semgrep_rules"),
+}
+
+
+def _get_task(command: str) -> Callable[[], bool] | None:
+    """Import the module providing a command and return its task function."""
+    if command == "all":
+        return task_all
+    target = TASKS.get(command)
+    if target is None:
+        return None
+    module_name, func_name = target
+    module = importlib.import_module(f"services.quality.{module_name}")
+    task: Callable[[], bool] = getattr(module, func_name)
+    return task
 
 
 def task_all() -> bool:
@@ -53,15 +74,11 @@ def task_all() -> bool:
     }
 
     # Run all checks
-    results["lint"] = task_lint()
-    print("")
-    results["security"] = task_security()
-    print("")
-    results["test"] = task_test()
-    print("")
-    results["complexity"] = task_complexity()
-    print("")
-    results["cleanup"] = task_cleanup()
+    for idx, check_name in enumerate(results):
+        if idx:
+            print("")
+        task = _get_task(check_name)
+        results[check_name] = task is not None and task()
 
     # Summary
     print("\n" + "=" * 70)
@@ -93,28 +110,18 @@ def main() -> int:
         print("  test      Run tests (pytest)")
         print("  complexity  Analyze code complexity (radon)")
         print("  cleanup   Detect unused code, imports, and redundancies (vulture, autoflake, pylint)")
+        print("  pylint-daemon  Keep a Pylint worker running so lint skips its startup")
+        print("  semgrep-rules  Download Semgrep registry rules so scans read them from disk")
         return 1
 
     command = sys.argv[1].lower()
-
-    if command == "all":
-        success = task_all()
-    elif command == "lint":
-        success = task_lint()
-    elif command == "security":
-        success = task_security()
-    elif command == "test":
-        success = task_test()
-    elif command == "complexity":
-        success = task_complexity()
-    elif command == "cleanup":
-        success = task_cleanup()
-    else:
+    handler = _get_task(command)
+    if handler is None:
         print_error(f"Unknown command: {command}")
-        print("Available commands: all, lint, security, test, complexity, cleanup")
+        print(f"Available commands: all, {', '.join(TASKS)}")
         return 1
 
-    return 0 if success else 1
+    return 0 if handler() else 1
 
 
 if __name__ == "__main__":
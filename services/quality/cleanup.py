@@ -2,21 +2,24 @@
 
 from __future__ import annotations
 
-import platform
-
 # Use common imports from quality.common
 from services.quality import common
 
 # Import from common
-VENV_BIN = common.VENV_BIN
 print_info = common.print_info
 print_success = common.print_success
 print_error = common.print_error
 print_warning = common.print_warning
 print_separator = common.print_separator
 venv_exists = common.venv_exists
+venv_tool = common.venv_tool
 get_code_directories = common.get_code_directories
 run_command = common.run_command
+compute_source_fingerprint = common.compute_source_fingerprint
+tool_cache_key = common.tool_cache_key
+cache_lookup = common.cache_lookup
+cache_store = common.cache_store
+ToolResult = common.ToolResult
 
 
 def task_cleanup() -> bool:
@@ -28,59 +31,64 @@ def task_cleanup() -> bool:
     print_info("CODE CLEANUP ANALYSIS")
     print_separator()
 
-    vulture = VENV_BIN / ("vulture.exe" if platform.system() == "Windows" else "vulture")
-    autoflake = VENV_BIN / ("autoflake.exe" if platform.system() == "Windows" else "autoflake")
-    pylint = VENV_BIN / ("pylint.exe" if platform.system() == "Windows" else "pylint")
+    vulture = venv_tool("vulture")
+    autoflake = venv_tool("autoflake")
+    pylint = venv_tool("pylint")
     targets = get_code_directories()
 
-    results = {
-        "vulture": False,
-        "autoflake": False,
-        "pylint": False,
-    }
+    steps = [
+        (
+            "vulture",
+            "1/3 - Running Vulture (Dead Code Detection)",
+            [str(vulture), *targets, "--min-confidence", "80"],
+            "✓ Vulture: No dead code found",
+            "⚠ Vulture: Potential dead code detected (review above)",
+        ),
+        (
+            "autoflake",
+            "2/3 - Running Autoflake (Unused Imports Check)",
+            [
+                str(autoflake),
+                "--check",
+                "--recursive",
+                "--remove-all-unused-imports",
+                "--remove-unused-variables",
+                *targets,
+            ],
+            "✓ Autoflake: No unused imports or variables",
+            "⚠ Autoflake: Unused imports/variables found",
+        ),
+        (
+            "pylint",
+            "3/3 - Running Pylint (Code Quality & Redundancies)",
+            [str(pylint), *targets, "--fail-under=8.0", "--disable=C0111,C0103,R0903"],
+            "✓ Pylint: Code quality score >= 8.0/10",
+            "⚠ Pylint: Code quality issues found (review above)",
+        ),
+    ]
 
-    # Vulture - Dead code detection
-    print("\n" + "-" * 70)
-    print_info("1/3 - Running Vulture (Dead Code Detection)")
-    print("-" * 70)
-    success, _ = run_command([str(vulture), *targets, "--min-confidence", "80"], check=False)
-    if success:
-        print_success("✓ Vulture: No dead code found")
-        results["vulture"] = True
-    else:
-        print_warning("⚠ Vulture: Potential dead code detected (review above)")
+    # Checks whose last passing run saw the same sources, config and executable
+    # are not rerun; cache entries are prefixed so they do not clash with lint's
+    fingerprint = compute_source_fingerprint(targets)
+    results = {}
+    for name, title, cmd, passed, failed in steps:
+        print("\n" + "-" * 70)
+        print_info(title)
+        print("-" * 70)
+        cache_name = f"cleanup-{name}"
+        key = tool_cache_key(cmd, fingerprint)
+        if cache_lookup(cache_name, key) is not None:
+            print_success(f"{passed} (cached)")
+            results[name] = True
+            continue
 
-    # Autoflake - Unused imports check
-    print("\n" + "-" * 70)
-    print_info("2/3 - Running Autoflake (Unused Imports Check)")
-    print("-" * 70)
-    autoflake_cmd = [
-        str(autoflake),
-        "--check",
-        "--recursive",
-        "--remove-all-unused-imports",
-        "--remove-unused-variables",
-    ] + targets
-    success, _ = run_command(autoflake_cmd, check=False)
-    if success:
-        print_success("✓ Autoflake: No unused imports or variables")
-        results["autoflake"] = True
-    else:
-        print_warning("⚠ Autoflake: Unused imports/variables found")
-
-    # Pylint - Code quality and redundancies
-    print("\n" + "-" * 70)
-    print_info("3/3 - Running Pylint (Code Quality & Redundancies)")
-    print("-" * 70)
-    success, _ = run_command(
-        [str(pylint), *targets, "--fail-under=8.0", "--disable=C0111,C0103,R0903"],
-        check=False,
-    )
-    if success:
-        print_success("✓ Pylint: Code quality score >= 8.0/10")
-        results["pylint"] = True
-    else:
-        print_warning("⚠ Pylint: Code quality issues found (review above)")
+        success, _ = run_command(cmd, check=False)
+        if success:
+            print_success(passed)
+            cache_store(cache_name, key, ToolResult(status=True))
+        else:
+            print_warning(failed)
+        results[name] = success
 
     all_passed = all(results.values())
     if all_passed:
@@ -10,9 +10,14 @@ from services import utils
 
 # Export common constants
 PROJECT_ROOT = utils.PROJECT_ROOT
+IS_WINDOWS = utils.IS_WINDOWS
+EXE = utils.EXE
 VENV_BIN = utils.VENV_BIN
+VENV_DIR = utils.VENV_DIR
 
 # Export common utility functions
+ToolResult = utils.ToolResult
+OutputBuffer = utils.OutputBuffer
 print_info = utils.print_info
 print_success = utils.print_success
 print_error = utils.print_error
@@ -22,5 +27,17 @@ print_separator = utils.print_separator
 venv_exists = utils.venv_exists
 get_code_directories = utils.get_code_directories
 run_command = utils.run_command
+run_captured = utils.run_captured
+run_commands_parallel = utils.run_commands_parallel
+parallel_enabled = utils.parallel_enabled
+compute_source_fingerprint = utils.compute_source_fingerprint
+tool_cache_key = utils.tool_cache_key
+cache_lookup = utils.cache_lookup
+cache_store = utils.cache_store
 check_venv_required = utils.check_venv_required
+ensure_tool = utils.ensure_tool
+venv_tool = utils.venv_tool
+parse_json_output = utils.parse_json_output
+skipped_result = utils.skipped_result
+getenv = utils.getenv
 
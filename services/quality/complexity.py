@@ -2,18 +2,16 @@
 
 from __future__ import annotations
 
-import platform
-
 # Use common imports from quality.common
 from services.quality import common
 
 # Import from common
-VENV_BIN = common.VENV_BIN
 print_info = common.print_info
 print_success = common.print_success
 print_error = common.print_error
 print_separator = common.print_separator
 venv_exists = common.venv_exists
+venv_tool = common.venv_tool
 get_code_directories = common.get_code_directories
 run_command = common.run_command
 
@@ -27,7 +25,7 @@ def task_complexity() -> bool:
     print_info("CODE COMPLEXITY ANALYSIS")
     print_separator()
 
-    radon = VENV_BIN / ("radon.exe" if platform.system() == "Windows" else "radon")
+    radon = venv_tool("radon")
     targets = get_code_directories()
 
     # Cyclomatic Complexity
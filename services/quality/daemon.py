@@ -0,0 +1,127 @@
+"""Optional persistent Pylint worker.
+
+Start it with `./service.py quality pylint-daemon`. While it is running,
+`quality lint` sends its Pylint run to the worker instead of starting a new
+interpreter that has to import Pylint and its plugins again.
+
+The worker runs as a script under the project virtual environment, so this
+module only depends on the standard library at import time.
+"""
+
+from __future__ import annotations
+
+import importlib
+import io
+import os
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout, suppress
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+CACHE_DIR = Path(__file__).resolve().parent.parent.parent / ".cache"
+SOCKET_PATH = CACHE_DIR / "pylint.sock"
+KEY_PATH = CACHE_DIR / "pylint.key"
+
+_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def _authkey(create: bool = False) -> bytes | None:
+    """Read the shared connection key, creating it (mode 0600) if requested."""
+    try:
+        return KEY_PATH.read_bytes()
+    except OSError:
+        if not create:
+            return None
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    key = os.urandom(32)
+    fd = os.open(KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(key)
+    return key
+
+
+def daemon_available() -> bool:
+    """Return True if a Pylint worker appears to be running."""
+    return sys.platform != "win32" and SOCKET_PATH.exists() and KEY_PATH.exists()
+
+
+def call(args: list[str]) -> tuple[bool, str] | None:
+    """Run Pylint with the given arguments in the worker.
+
+    Returns:
+        Tuple of (success, output), or None if the worker could not be reached
+    """
+    authkey = _authkey()
+    if authkey is None:
+        return None
+    try:
+        with Client(str(SOCKET_PATH), family="AF_UNIX", authkey=authkey) as conn:
+            conn.send(args)
+            result: tuple[bool, str] = conn.recv()
+            return result
+    except (OSError, EOFError, AuthenticationError):
+        return None
+
+
+def submit(args: list[str]) -> Future[tuple[bool, str] | None]:
+    """Send a Pylint run to the worker in the background."""
+    return _executor.submit(call, args)
+
+
+def _run_pylint(args: list[str]) -> tuple[bool, str]:
+    """Run Pylint in this process, returning (success, captured output)."""
+    from astroid import MANAGER
+    from pylint.lint import Run
+
+    # Parse sources afresh on every run; only the imports stay warm
+    MANAGER.clear_cache()
+    output = io.StringIO()
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            run = Run(args, exit=False)
+        success = run.linter.msg_status == 0
+    except SystemExit as exc:
+        success = exc.code == 0
+    except Exception:  # pylint: disable=broad-exception-caught
+        # Report a crash to the client rather than stopping the daemon
+        return (False, output.getvalue() + traceback.format_exc())
+    return (success, output.getvalue())
+
+
+def serve() -> int:
+    """Serve Pylint runs until interrupted."""
+    # Import Pylint up front, so a missing install fails here and runs start warm
+    importlib.import_module("pylint.lint")
+
+    authkey = _authkey(create=True)
+    with suppress(FileNotFoundError):
+        SOCKET_PATH.unlink()
+    print(f"Pylint daemon listening on {SOCKET_PATH} (Ctrl+C to stop)")
+
+    try:
+        with Listener(str(SOCKET_PATH), family="AF_UNIX", authkey=authkey) as listener:
+            while True:
+                try:
+                    conn = listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    continue
+                # A client that disconnects mid-request only loses its own result
+                with conn, suppress(EOFError, OSError):
+                    conn.send(_run_pylint(conn.recv()))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        with suppress(FileNotFoundError):
+            SOCKET_PATH.unlink()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(serve())
@@ -3,19 +3,19 @@
 
 from __future__ import annotations
 
-import platform
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
 from services import utils
-from services.quality import common
+from services.quality import common, daemon, runners, semgrep
 
 # Import from common
 # pylint: disable=R0801  # Duplicate code acceptable for common imports
 PROJECT_ROOT = common.PROJECT_ROOT
-VENV_BIN = common.VENV_BIN
+IS_WINDOWS = common.IS_WINDOWS
 print_info = common.print_info
 print_success = common.print_success
 print_error = common.print_error
@@ -23,24 +23,40 @@ print_warning = common.print_warning
 print_header = common.print_header
 print_separator = common.print_separator
 venv_exists = common.venv_exists
+venv_tool = common.venv_tool
 get_code_directories = common.get_code_directories
 run_command = common.run_command
+OutputBuffer = common.OutputBuffer
+ToolResult = common.ToolResult
+run_captured = common.run_captured
+run_commands_parallel = common.run_commands_parallel
+compute_source_fingerprint = common.compute_source_fingerprint
+tool_cache_key = common.tool_cache_key
+cache_lookup = common.cache_lookup
+cache_store = common.cache_store
+ensure_tool = common.ensure_tool
+skipped_result = common.skipped_result
+parse_json_output = common.parse_json_output
 
 # Import additional utils not in common
 print_results = utils.print_results
 summarize_results = utils.summarize_results
 print_summary = utils.print_summary
 
+# Keep tool caches in one known place so they survive runs and CI can restore them
+MYPY_CACHE = PROJECT_ROOT / ".cache" / "mypy"
+RUFF_CACHE = PROJECT_ROOT / ".cache" / "ruff"
 
-def _run_pylint_check(pylint: Path, targets: list[str]) -> tuple[bool, str | None]:
-    """Run Pylint check on Python files.
+
+def _build_pylint_command(pylint: Path, targets: Sequence[str]) -> list[str] | None:
+    """Build the Pylint command for all Python files in the targets.
 
     Args:
         pylint: Path to pylint executable
         targets: List of target directories/files to check
 
     Returns:
-        Tuple of (success: bool, output: str | None)
+        Pylint command, or None if no Python files were found
     """
     # Pylint needs specific Python files, not directories, so find all .py files
     python_files = []
@@ -56,108 +72,237 @@ def _run_pylint_check(pylint: Path, targets: list[str]) -> tuple[bool, str | Non
                         python_files.append(str(py_file))
 
     if not python_files:
-        print_warning("⚠ Pylint: No Python files found to check")
-        return (False, None)
+        return None
 
     # Enable duplicate-code group but disable R0801 specifically
     # This ensures other duplicate-code checks still run (if any are added in future)
     # Don't use --disable=all as it prevents Pylint from finding files
-    pylint_cmd = [
+    return [
         str(pylint),
         "--enable=duplicate-code",
         "--disable=R0801",
         "--ignore=migrations",
+        "--output-format=json",
     ] + python_files
-    success, output = run_command(
-        pylint_cmd,
-        check=False,
-        capture_output=True,
+
+
+def _ruff_result(success: bool, output: str) -> ToolResult:
+    """Count Ruff diagnostics from its JSON report."""
+    if success:
+        return ToolResult(status=True)
+    findings = parse_json_output(output)
+    errors = len(findings) if isinstance(findings, list) else 0
+    return ToolResult(status=False, errors=errors or 1)
+
+
+def _mypy_result(success: bool, output: str) -> ToolResult:
+    """Count MyPy errors from its `path:line: error: ...` output."""
+    if success:
+        return ToolResult(status=True)
+    errors = sum(1 for line in output.splitlines() if ": error:" in line)
+    return ToolResult(status=False, errors=errors or 1)
+
+
+def _pylint_result(success: bool, output: str) -> ToolResult:
+    """Count Pylint messages from its JSON report.
+
+    Pylint exits non-zero for any message, so a run that produced a report
+    fails only on `error` or `fatal` messages (e.g. F0001, a crash); the other
+    messages are reported in the counts. Without a report, e.g. on a usage
+    error, the exit status decides.
+    """
+    messages = parse_json_output(output)
+    if not isinstance(messages, list):
+        return ToolResult(status=success, errors=0 if success else 1)
+    errors = sum(1 for m in messages if m.get("type") in ("error", "fatal"))
+    return ToolResult(
+        status=success or errors == 0, errors=errors, warnings=len(messages) - errors
     )
-    # Pylint returns exit code 8 for warnings (not errors), which is acceptable
-    # Check if there are actual R0801 errors in output (should be none)
-    output_str = output or ""
-    has_r0801 = "R0801" in output_str
-    # Consider success if no R0801 errors found, even if exit code is non-zero
-    # (exit code 8 = warnings, which is acceptable)
-    # Also accept if we get a rating (means Pylint ran successfully)
-    has_rating = "rated" in output_str
-    pylint_success = success or (not has_r0801 and has_rating)
-    return (pylint_success, output)
 
 
-def task_lint() -> bool:
-    """Run linting checks."""
-    if not common.check_venv_required():
-        return False
+def _print_step(title: str, cmd: list[str] | None, cached: bool = False) -> None:
+    """Print a step header followed by the command that was run."""
+    with OutputBuffer() as out:
+        out.line()
+        out.separator("-")
+        out.info(title)
+        out.separator("-")
+        if cached:
+            out.info("Sources unchanged since last passing run (cached)")
+        elif cmd is not None:
+            out.info(f"Running: {' '.join(cmd)}")
 
-    print_separator()
-    print_header("LINTING CHECKS")
-    print_separator()
 
-    ruff = VENV_BIN / ("ruff.exe" if platform.system() == "Windows" else "ruff")
-    mypy = VENV_BIN / ("mypy.exe" if platform.system() == "Windows" else "mypy")
-    semgrep = VENV_BIN / ("semgrep.exe" if platform.system() == "Windows" else "semgrep")
-    pylint = VENV_BIN / ("pylint.exe" if platform.system() == "Windows" else "pylint")
-    targets = get_code_directories()
+def _lint_commands(targets: tuple[str, ...]) -> dict[str, list[str]]:
+    """Build the command for each linter; Pylint is left out if there are no files."""
+    commands = {
+        "ruff": [
+            str(venv_tool("ruff")),
+            "check",
+            "--cache-dir",
+            str(RUFF_CACHE),
+            "--output-format=json",
+            *targets,
+        ],
+        "mypy": [str(venv_tool("mypy")), "--cache-dir", str(MYPY_CACHE), *targets],
+        "semgrep": semgrep.semgrep_command(targets),
+    }
+    pylint_cmd = _build_pylint_command(venv_tool("pylint"), targets)
+    if pylint_cmd is not None:
+        commands["pylint"] = pylint_cmd
+    return commands
 
-    results = {}
 
-    # Ruff check
-    print("\n" + "-" * 70)
-    print_info("1/4 - Running Ruff")
-    print("-" * 70)
-    success, _ = run_command([str(ruff), "check", *targets], check=False, capture_output=True)
-    if success:
+def _partition_commands(
+    commands: dict[str, list[str]], targets: tuple[str, ...]
+) -> tuple[set[str], dict[str, str], set[str]]:
+    """Split the linters into missing tools, cache keys for the rest, and cached passes.
+
+    A tool is cached when its last passing run saw the same sources, config
+    and executable.
+    """
+    missing = {name for name, cmd in commands.items() if not ensure_tool(cmd[0])}
+    fingerprint = compute_source_fingerprint(targets)
+    cache_keys = {
+        name: tool_cache_key(cmd, fingerprint)
+        for name, cmd in commands.items()
+        if name not in missing
+    }
+    cached = {name for name, key in cache_keys.items() if cache_lookup(name, key) is not None}
+    return missing, cache_keys, cached
+
+
+def _collect_outputs(
+    pending: dict[str, list[str]], targets: tuple[str, ...]
+) -> dict[str, tuple[bool, str]]:
+    """Run the pending linters concurrently, each on the cheapest path available."""
+    if "semgrep" in pending and common.parallel_enabled():
+        semgrep.start_semgrep(targets)
+    # Hand Pylint to the persistent worker when one is running (see `pylint-daemon`)
+    pylint_future = None
+    if "pylint" in pending and daemon.daemon_available():
+        pylint_future = daemon.submit(pending["pylint"][1:])
+    # Tools with a Python API run in this interpreter when it is the venv's own
+    in_process = {}
+    for name, cmd in pending.items():
+        runner = runners.in_process_runner(name)
+        if runner is not None:
+            in_process[name] = runners.submit(runner, cmd[1:])
+    skip = {"semgrep", *in_process, *(["pylint"] if pylint_future is not None else [])}
+    outputs = run_commands_parallel({n: c for n, c in pending.items() if n not in skip})
+    outputs.update({name: future.result() for name, future in in_process.items()})
+    if "semgrep" in pending:
+        outputs["semgrep"] = semgrep.run_semgrep(targets)
+    if pylint_future is not None:
+        outputs["pylint"] = pylint_future.result() or run_captured(pending["pylint"])
+    return outputs
+
+
+def _report_ruff(outputs: dict[str, tuple[bool, str]]) -> ToolResult:
+    result = _ruff_result(*outputs["ruff"])
+    if result.status:
         print_success("✓ Ruff: No issues found")
-        results["ruff"] = {"status": True, "errors": 0, "warnings": 0}
     else:
-        print_warning("⚠ Ruff: Issues found")
-        results["ruff"] = {"status": False, "errors": 1, "warnings": 0}
-
-    # MyPy type checking
-    print("\n" + "-" * 70)
-    print_info("2/4 - Running MyPy")
-    print("-" * 70)
-    success, _ = run_command([str(mypy), *targets], check=False, capture_output=True)
-    if success:
+        print_warning(f"⚠ Ruff: Issues found ({result.errors})")
+    return result
+
+
+def _report_mypy(outputs: dict[str, tuple[bool, str]]) -> ToolResult:
+    result = _mypy_result(*outputs["mypy"])
+    if result.status:
         print_success("✓ MyPy: No type issues found")
-        results["mypy"] = {"status": True, "errors": 0, "warnings": 0}
     else:
-        print_warning("⚠ MyPy: Type issues found")
-        results["mypy"] = {"status": False, "errors": 1, "warnings": 0}
-
-    # Pylint - Code quality and duplicate code detection
-    # Note: R0801 (duplicate-code) is disabled as it flags acceptable structural duplication
-    # (common imports pattern) which is intentional for maintainability
-    # Also ignore migrations directories as they are auto-generated
-    print("\n" + "-" * 70)
-    print_info("3/4 - Running Pylint (Code Quality & Duplicate Code)")
-    print("-" * 70)
-    success, _ = _run_pylint_check(pylint, targets)
-    if success:
+        print_warning(f"⚠ MyPy: Type issues found ({result.errors})")
+    return result
+
+
+def _report_pylint(outputs: dict[str, tuple[bool, str]]) -> ToolResult:
+    if "pylint" not in outputs:
+        print_warning("⚠ Pylint: No Python files found to check")
+        result = ToolResult(status=False, errors=1)
+    else:
+        result = _pylint_result(*outputs["pylint"])
+    messages = result.errors + result.warnings
+    if result.status and messages:
+        print_success(f"✓ Pylint: No errors found ({messages} other messages)")
+    elif result.status:
         print_success("✓ Pylint: No duplicate code or quality issues found")
-        results["pylint"] = {"status": True, "errors": 0, "warnings": 0}
     else:
-        print_warning("⚠ Pylint: Duplicate code or quality issues found")
-        results["pylint"] = {"status": False, "errors": 1, "warnings": 0}
-
-    # Semgrep - Code quality and security patterns
-    print("\n" + "-" * 70)
-    print_info("4/4 - Running Semgrep (Code Quality & Security Patterns)")
-    print("-" * 70)
-    semgrep_cmd = utils.build_semgrep_command(semgrep, targets)
-    success, _ = run_command(semgrep_cmd, check=False, capture_output=True)
-    if success:
+        print_warning(f"⚠ Pylint: Errors found ({result.errors})")
+    return result
+
+
+def _report_semgrep(outputs: dict[str, tuple[bool, str]]) -> ToolResult:
+    result = semgrep.semgrep_result(*outputs["semgrep"])
+    if result.status:
         print_success("✓ Semgrep: No issues found")
-        results["semgrep"] = {"status": True, "errors": 0, "warnings": 0}
     else:
-        print_warning("⚠ Semgrep: Issues found")
-        results["semgrep"] = {"status": False, "errors": 1, "warnings": 0}
+        print_warning(f"⚠ Semgrep: Issues found ({result.errors})")
+    return result
+
+
+# Report order: tool name, step title, display name, report function.
+# Pylint covers code quality and duplicate code detection. R0801 (duplicate-code)
+# is disabled as it flags acceptable structural duplication (common imports
+# pattern) which is intentional for maintainability, and migrations directories
+# are ignored as they are auto-generated.
+LINT_STEPS = (
+    ("ruff", "1/4 - Running Ruff", "Ruff", _report_ruff),
+    ("mypy", "2/4 - Running MyPy", "MyPy", _report_mypy),
+    ("pylint", "3/4 - Running Pylint (Code Quality & Duplicate Code)", "Pylint", _report_pylint),
+    (
+        "semgrep",
+        "4/4 - Running Semgrep (Code Quality & Security Patterns)",
+        "Semgrep",
+        _report_semgrep,
+    ),
+)
+
+
+def task_lint() -> bool:
+    """Run linting checks."""
+    if not common.check_venv_required():
+        return False
+
+    with OutputBuffer() as out:
+        out.separator()
+        out.header("LINTING CHECKS")
+        out.separator()
+
+    # The four linters are independent, so run them concurrently and report in order
+    targets = get_code_directories()
+    commands = _lint_commands(targets)
+    missing, cache_keys, cached = _partition_commands(commands, targets)
+    pending = {n: c for n, c in commands.items() if n not in missing and n not in cached}
+    outputs = _collect_outputs(pending, targets)
+    outputs.update(dict.fromkeys(cached, (True, "")))
+
+    results: dict[str, ToolResult] = {}
+    for name, title, label, report in LINT_STEPS:
+        _print_step(title, pending.get(name), name in cached)
+        results[name] = skipped_result(label) if name in missing else report(outputs)
+
+    for name, key in cache_keys.items():
+        if results[name].status and name not in cached:
+            cache_store(name, key, results[name])
 
     # Print results summary
-    print_results(results, title="Linting Results", format="table")  # type: ignore[arg-type]
-    summary = summarize_results(results)  # type: ignore[arg-type]
+    print_results(results, title="Linting Results", format="table")
+    summary = summarize_results(results)
     print_summary(summary)
 
-    return all(r.get("status", False) for r in results.values())
+    return all(r.status for r in results.values())
+
+
+def task_pylint_daemon() -> bool:
+    """Run a persistent Pylint worker in the foreground until interrupted."""
+    if not common.check_venv_required():
+        return False
+
+    if IS_WINDOWS:
+        print_error("The Pylint daemon needs Unix domain sockets and is not available on Windows")
+        return False
 
+    python = venv_tool("python")
+    success, _ = run_command([str(python), daemon.__file__], check=False)
+    return success
@@ -0,0 +1,76 @@
+"""In-process runners for quality tools that expose a Python API.
+
+Calling a tool's API skips starting a new interpreter for it. The tools are
+installed in the project virtual environment, so this only applies when the
+service itself runs under that environment's interpreter from the project
+root, where the subprocesses would run and where the tools find their config;
+otherwise, or with QUALITY_IN_PROCESS=0, the tools run as subprocesses.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Future
+
+    Runner = Callable[[Sequence[str]], tuple[bool, str]]
+
+from services.quality import common
+
+_executor = ThreadPoolExecutor(max_workers=2)
+
+
+def run_mypy(args: Sequence[str]) -> tuple[bool, str]:
+    """Run mypy through `mypy.api`, returning (success, combined stdout/stderr)."""
+    from mypy import api
+
+    stdout, stderr, exit_status = api.run(list(args))
+    return (exit_status == 0, stdout + stderr)
+
+
+# Tool name -> (module providing the API, runner taking the tool's arguments)
+IN_PROCESS_RUNNERS: dict[str, tuple[str, Runner]] = {
+    "mypy": ("mypy.api", run_mypy),
+}
+
+
+def _running_in_venv() -> bool:
+    """Return True if this interpreter belongs to the project virtual environment."""
+    return Path(sys.prefix).resolve() == common.VENV_DIR.resolve()
+
+
+def in_process_runner(tool: str) -> Runner | None:
+    """Return the in-process runner for a tool, or None to use a subprocess."""
+    # Targets are relative to the project root, like the subprocess cwd
+    if Path(os.getcwd()).resolve() != common.PROJECT_ROOT.resolve():
+        return None
+    return _available_runner(tool)
+
+
+@cache
+def _available_runner(tool: str) -> Runner | None:
+    """Return the runner for a tool if it is enabled and its API can be imported."""
+    entry = IN_PROCESS_RUNNERS.get(tool)
+    if entry is None or common.getenv("QUALITY_IN_PROCESS", "1") == "0":
+        return None
+    if not _running_in_venv():
+        return None
+    module_name, runner = entry
+    try:
+        found = importlib.util.find_spec(module_name) is not None
+    except ModuleNotFoundError:
+        found = False
+    return runner if found else None
+
+
+def submit(runner: Runner, args: Sequence[str]) -> Future[tuple[bool, str]]:
+    """Start an in-process run in the background."""
+    return _executor.submit(runner, args)
@@ -3,20 +3,17 @@
 
 from __future__ import annotations
 
-import os
-import platform
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pathlib import Path
 
 from services import utils
-from services.quality import common
+from services.quality import common, semgrep
 
 # Import from common
 # pylint: disable=R0801  # Duplicate code acceptable for common imports
 PROJECT_ROOT = common.PROJECT_ROOT
-VENV_BIN = common.VENV_BIN
 print_info = common.print_info
 print_success = common.print_success
 print_error = common.print_error
@@ -24,8 +21,19 @@ print_warning = common.print_warning
 print_header = common.print_header
 print_separator = common.print_separator
 venv_exists = common.venv_exists
+venv_tool = common.venv_tool
 get_code_directories = common.get_code_directories
 run_command = common.run_command
+OutputBuffer = common.OutputBuffer
+ToolResult = common.ToolResult
+run_commands_parallel = common.run_commands_parallel
+compute_source_fingerprint = common.compute_source_fingerprint
+tool_cache_key = common.tool_cache_key
+cache_lookup = common.cache_lookup
+cache_store = common.cache_store
+ensure_tool = common.ensure_tool
+skipped_result = common.skipped_result
+getenv = common.getenv
 
 # Import additional utils not in common
 print_results = utils.print_results
@@ -33,46 +41,59 @@ summarize_results = utils.summarize_results
 print_summary = utils.print_summary
 
 
-def _run_bandit_check(bandit: Path, targets: list[str]) -> tuple[bool, int, int]:
-    """Run Bandit security check.
+def _print_step(
+    title: str, cmd: list[str] | None, output: str | None = None, cached: bool = False
+) -> None:
+    """Print a step header, the command that was run and its buffered output."""
+    with OutputBuffer() as out:
+        out.line()
+        out.separator("-")
+        out.info(title)
+        out.separator("-")
+        if cached:
+            out.info("Sources unchanged since last passing run (cached)")
+        elif cmd is not None:
+            out.info(f"Running: {' '.join(cmd)}")
+            if output:
+                out.line(output.rstrip("\n"))
+
+
+def _safety_command(safety: Path) -> list[str]:
+    """Build the Safety scan command, authenticating with SAFETY_API_KEY if set."""
+    safety_cmd = [str(safety), "scan", "--output", "json"]
+    safety_api_key = getenv("SAFETY_API_KEY")
+    if safety_api_key:
+        safety_cmd.extend(["--key", safety_api_key])
+    return safety_cmd
+
+
+def _report_bandit(success: bool) -> ToolResult:
+    """Report the Bandit security check.
 
     Returns:
-        Tuple of (success: bool, errors: int, warnings: int)
+        Result of the check
     """
-    print("\n" + "-" * 70)
-    print_info("1/4 - Running Bandit (Static Code Analysis)")
-    print("-" * 70)
-    success, _ = run_command(
-        [str(bandit), "-r", *targets, "-ll", "-f", "screen", "--skip", "B101"],
-        check=False,
-    )
     if success:
         print_success("✓ Bandit: No high/medium issues found")
-        return (True, 0, 0)
+        return ToolResult(status=True)
     else:
         print_warning("⚠ Bandit: Issues found (review above)")
-        return (False, 1, 0)
+        return ToolResult(status=False, errors=1)
 
 
-def _run_safety_check(safety: Path) -> tuple[bool, int, int]:
-    """Run Safety dependency vulnerability check.
+def _report_safety(success: bool) -> ToolResult:
+    """Report the Safety dependency vulnerability check.
 
     Returns:
-        Tuple of (success: bool, errors: int, warnings: int)
+        Result of the check
     """
-    print("\n" + "-" * 70)
-    print_info("2/4 - Running Safety (Dependency Vulnerabilities)")
-    print("-" * 70)
-    safety_cmd = [str(safety), "scan", "--output", "json"]
-    safety_api_key = os.environ.get("SAFETY_API_KEY")
+    safety_api_key = getenv("SAFETY_API_KEY")
     if safety_api_key:
-        safety_cmd.extend(["--key", safety_api_key])
         print_info("   Using SAFETY_API_KEY from environment")
 
-    safety_result, _ = run_command(safety_cmd, check=False)
-    if safety_result:
+    if success:
         print_success("✓ Safety: No vulnerabilities found")
-        return (True, 0, 0)
+        return ToolResult(status=True)
 
     if not safety_api_key:
         print_warning("⚠ Safety: Unable to complete scan (authentication required)")
@@ -80,31 +101,26 @@ def _run_safety_check(safety: Path) -> tuple[bool, int, int]:
         print_info("   Option 1: Register at https://pyup.io/safety/ and set SAFETY_API_KEY env var")
         print_info("   Option 2: Run 'safety auth' to authenticate interactively")
         print_info("   For now, treating as skipped (not a failure)")
-        return (True, 0, 0)  # Count as pass since it's optional
+        return ToolResult(status=True)  # Count as pass since it's optional
 
     print_warning("⚠ Safety: Scan completed but issues may have been found")
-    return (False, 1, 0)
+    return ToolResult(status=False, errors=1)
 
 
-def _run_pip_audit_check(pip_audit: Path) -> tuple[bool, int, int]:
-    """Run Pip-Audit vulnerability check.
+def _report_pip_audit(success: bool, output: str) -> ToolResult:
+    """Report the Pip-Audit vulnerability check.
 
     Returns:
-        Tuple of (success: bool, errors: int, warnings: int)
+        Result of the check
     """
-    print("\n" + "-" * 70)
-    print_info("3/4 - Running Pip-Audit (PyPI Vulnerabilities)")
-    print("-" * 70)
-    success, output = run_command([str(pip_audit)], check=False, capture_output=True)
     if success:
         print_success("✓ Pip-Audit: No vulnerabilities found")
-        return (True, 0, 0)
+        return ToolResult(status=True)
 
     # Check if vulnerabilities are in known transitive dependencies
     # (e.g., mcp via semgrep - this is a known issue that will be fixed when semgrep updates)
-    output_str = output or ""
     known_transitive_vulns = ["mcp"]
-    has_known_transitive = any(vuln in output_str for vuln in known_transitive_vulns)
+    has_known_transitive = any(vuln in output for vuln in known_transitive_vulns)
 
     if has_known_transitive:
         print_warning("⚠ Pip-Audit: Vulnerabilities found in transitive dependencies")
@@ -112,29 +128,23 @@ def _run_pip_audit_check(pip_audit: Path) -> tuple[bool, int, int]:
         print_info("   They will be fixed when the parent package (semgrep) is updated")
         print_info("   This is tracked and will be resolved in a future semgrep release")
         # Count as warning, not error, since it's a transitive dependency
-        return (True, 0, 1)
+        return ToolResult(status=True, warnings=1)
     else:
         print_warning("⚠ Pip-Audit: Vulnerabilities found (review above)")
-        return (False, 1, 0)
+        return ToolResult(status=False, errors=1)
 
 
-def _run_semgrep_check(semgrep: Path, targets: list[str]) -> tuple[bool, int, int]:
-    """Run Semgrep SAST check.
+def _report_semgrep(result: ToolResult) -> ToolResult:
+    """Report the Semgrep SAST check.
 
     Returns:
-        Tuple of (success: bool, errors: int, warnings: int)
+        Result of the check
     """
-    print("\n" + "-" * 70)
-    print_info("4/4 - Running Semgrep (SAST)")
-    print("-" * 70)
-    semgrep_cmd = utils.build_semgrep_command(semgrep, targets)
-    success, _ = run_command(semgrep_cmd, check=False)
-    if success:
+    if result.status:
         print_success("✓ Semgrep: No issues found")
-        return (True, 0, 0)
     else:
         print_warning("⚠ Semgrep: Issues found (review above)")
-        return (False, 1, 0)
+    return result
 
 
 def task_security() -> bool:
@@ -142,36 +152,93 @@ def task_security() -> bool:
     if not common.check_venv_required():
         return False
 
-    print_separator()
-    print_header("SECURITY CHECKS")
-    print_separator()
+    with OutputBuffer() as out:
+        out.separator()
+        out.header("SECURITY CHECKS")
+        out.separator()
 
-    exe_suffix = ".exe" if platform.system() == "Windows" else ""
-    bandit = VENV_BIN / f"bandit{exe_suffix}"
-    safety = VENV_BIN / f"safety{exe_suffix}"
-    pip_audit = VENV_BIN / f"pip-audit{exe_suffix}"
-    semgrep = VENV_BIN / f"semgrep{exe_suffix}"
+    bandit = venv_tool("bandit")
+    safety = venv_tool("safety")
+    pip_audit = venv_tool("pip-audit")
     targets = get_code_directories()
 
-    results = {}
-
-    # Run all security checks
-    bandit_success, bandit_errors, bandit_warnings = _run_bandit_check(bandit, targets)
-    results["bandit"] = {"status": bandit_success, "errors": bandit_errors, "warnings": bandit_warnings}
+    # The scanners are independent, so run them concurrently and report in order
+    commands = {
+        "bandit": [str(bandit), "-r", *targets, "-ll", "-f", "screen", "--skip", "B101"],
+        "safety": _safety_command(safety),
+        "pip_audit": [str(pip_audit)],
+        "semgrep": semgrep.semgrep_command(targets),
+    }
+
+    # Skip scanners that are not installed. Safety and Pip-Audit query live
+    # vulnerability databases, so only the source scanners are skipped when
+    # nothing changed since their last pass
+    missing = {name for name, cmd in commands.items() if not ensure_tool(cmd[0])}
+    fingerprint = compute_source_fingerprint(targets)
+    cache_keys = {
+        name: tool_cache_key(commands[name], fingerprint)
+        for name in ("bandit", "semgrep")
+        if name not in missing
+    }
+    cached = {name for name, key in cache_keys.items() if cache_lookup(name, key) is not None}
+    pending = {n: c for n, c in commands.items() if n not in missing and n not in cached}
+    if "semgrep" in pending and common.parallel_enabled():
+        semgrep.start_semgrep(targets)
+    outputs = run_commands_parallel({n: c for n, c in pending.items() if n != "semgrep"})
+    outputs.update(dict.fromkeys(cached, (True, "")))
+    if "semgrep" in pending:
+        outputs["semgrep"] = semgrep.run_semgrep(targets)
+
+    results: dict[str, ToolResult] = {}
+
+    bandit_success, bandit_output = outputs.get("bandit", (True, ""))
+    _print_step(
+        "1/4 - Running Bandit (Static Code Analysis)",
+        pending.get("bandit"),
+        bandit_output,
+        "bandit" in cached,
+    )
+    if "bandit" in missing:
+        results["bandit"] = skipped_result("Bandit")
+    else:
+        results["bandit"] = _report_bandit(bandit_success)
 
-    safety_success, safety_errors, safety_warnings = _run_safety_check(safety)
-    results["safety"] = {"status": safety_success, "errors": safety_errors, "warnings": safety_warnings}
+    safety_success, safety_output = outputs.get("safety", (True, ""))
+    _print_step(
+        "2/4 - Running Safety (Dependency Vulnerabilities)", pending.get("safety"), safety_output
+    )
+    if "safety" in missing:
+        results["safety"] = skipped_result("Safety")
+    else:
+        results["safety"] = _report_safety(safety_success)
 
-    pip_audit_success, pip_audit_errors, pip_audit_warnings = _run_pip_audit_check(pip_audit)
-    results["pip_audit"] = {"status": pip_audit_success, "errors": pip_audit_errors, "warnings": pip_audit_warnings}
+    pip_audit_success, pip_audit_output = outputs.get("pip_audit", (True, ""))
+    _print_step("3/4 - Running Pip-Audit (PyPI Vulnerabilities)", pending.get("pip_audit"))
+    if "pip_audit" in missing:
+        results["pip_audit"] = skipped_result("Pip-Audit")
+    else:
+        results["pip_audit"] = _report_pip_audit(pip_audit_success, pip_audit_output)
+
+    semgrep_success, semgrep_output = outputs.get("semgrep", (True, ""))
+    _print_step(
+        "4/4 - Running Semgrep (SAST)",
+        pending.get("semgrep"),
+        semgrep.format_findings(semgrep_output),
+        "semgrep" in cached,
+    )
+    if "semgrep" in missing:
+        results["semgrep"] = skipped_result("Semgrep")
+    else:
+        semgrep_result = semgrep.semgrep_result(semgrep_success, semgrep_output)
+        results["semgrep"] = _report_semgrep(semgrep_result)
 
-    semgrep_success, semgrep_errors, semgrep_warnings = _run_semgrep_check(semgrep, targets)
-    results["semgrep"] = {"status": semgrep_success, "errors": semgrep_errors, "warnings": semgrep_warnings}
+    for name, key in cache_keys.items():
+        if results[name].status and name not in cached:
+            cache_store(name, key, results[name])
 
     # Print results summary
-    print_results(results, title="Security Results", format="table")  # type: ignore[arg-type]
-    summary = summarize_results(results)  # type: ignore[arg-type]
+    print_results(results, title="Security Results", format="table")
+    summary = summarize_results(results)
     print_summary(summary)
 
-    return all(r.get("status", False) for r in results.values())
-
+    return all(r.status for r in results.values())
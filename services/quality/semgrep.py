@@ -0,0 +1,115 @@
+"""Shared Semgrep run for the lint and security checks."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+from services import utils
+from services.quality import common
+
+SEMGREP = common.venv_tool("semgrep")
+REGISTRY_URL = "https://semgrep.dev/c"
+
+_executor = ThreadPoolExecutor(max_workers=1)
+
+
+def semgrep_command(targets: tuple[str, ...]) -> list[str]:
+    """Build the Semgrep scan command for the targets, with a JSON report."""
+    return [*utils.build_semgrep_command(SEMGREP, targets), "--json"]
+
+
+def semgrep_result(success: bool, output: str) -> utils.ToolResult:
+    """Count Semgrep findings from its JSON report.
+
+    ERROR-severity findings are errors and fail the check; everything else
+    is reported as a warning.
+    """
+    report = common.parse_json_output(output)
+    if not isinstance(report, dict):
+        return utils.ToolResult(status=success, errors=0 if success else 1)
+    findings = report.get("results", [])
+    errors = sum(1 for f in findings if f.get("extra", {}).get("severity") == "ERROR")
+    if not success:
+        errors = errors or 1
+    return utils.ToolResult(status=errors == 0, errors=errors, warnings=len(findings) - errors)
+
+
+def format_findings(output: str) -> str:
+    """Render Semgrep's JSON report as one line per finding."""
+    report = common.parse_json_output(output)
+    if not isinstance(report, dict):
+        return output
+    return "\n".join(
+        f"{f.get('path')}:{f.get('start', {}).get('line')}: "
+        f"[{f.get('extra', {}).get('severity', 'INFO')}] {f.get('check_id')}"
+        for f in report.get("results", [])
+    )
+
+
+@cache
+def start_semgrep(targets: tuple[str, ...]) -> Future[tuple[bool, str]]:
+    """Start Semgrep in the background, at most once per process and target set.
+
+    Lint and security scan with the same configs, so the second caller
+    reuses the first run instead of loading the rules again.
+
+    Args:
+        targets: Target directories to scan
+
+    Returns:
+        Future resolving to (success, combined stdout/stderr)
+    """
+    return _executor.submit(common.run_captured, semgrep_command(targets))
+
+
+def run_semgrep(targets: tuple[str, ...]) -> tuple[bool, str]:
+    """Return the (possibly shared) Semgrep result for the targets."""
+    return start_semgrep(targets).result()
+
+
+def task_semgrep_rules() -> bool:
+    """Download the registry rulesets used by the scans into `.cache/semgrep-rules/`.
+
+    The rules come straight from the registry URL that `--config p/...`
+    resolves to; Semgrep no longer has a `--dump-config` option to export them.
+    """
+    utils.SEMGREP_RULES_DIR.mkdir(parents=True, exist_ok=True)
+
+    success = True
+    for config in utils.semgrep_configs():
+        if not config.startswith("p/"):
+            continue
+        url = f"{REGISTRY_URL}/{config}"
+        common.print_info(f"Downloading {url}")
+        try:
+            with urllib.request.urlopen(url, timeout=60) as response:  # nosec B310
+                rules = response.read()
+        except OSError as e:
+            common.print_warning(f"Could not download {config}: {e}")
+            success = False
+            continue
+
+        target = utils.vendored_semgrep_rules(config)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(rules)
+            os.replace(tmp_path, target)
+        except OSError as e:
+            with suppress(OSError):
+                os.unlink(tmp_path)
+            common.print_warning(f"Could not save {config}: {e}")
+            success = False
+            continue
+        common.print_success(f"Saved {config} to {target.relative_to(common.PROJECT_ROOT)}")
+
+    return success
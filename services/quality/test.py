@@ -2,19 +2,40 @@
 
 from __future__ import annotations
 
-import platform
+from functools import lru_cache
 
 # Use common imports from quality.common
 from services.quality import common
 
 # Import from common
-VENV_BIN = common.VENV_BIN
 print_info = common.print_info
 print_success = common.print_success
 print_error = common.print_error
 print_separator = common.print_separator
 venv_exists = common.venv_exists
+venv_tool = common.venv_tool
 run_command = common.run_command
+parallel_enabled = common.parallel_enabled
+VENV_DIR = common.VENV_DIR
+
+
+@lru_cache(maxsize=1)
+def _xdist_available() -> bool:
+    """Return True if pytest-xdist is installed in the project virtual environment."""
+    patterns = ("lib/python*/site-packages/xdist", "Lib/site-packages/xdist")
+    return any(any(VENV_DIR.glob(pattern)) for pattern in patterns)
+
+
+def _pytest_command() -> list[str]:
+    """Build the pytest command, spreading tests over all CPUs when xdist is available.
+
+    `--dist=loadfile` keeps each file on one worker so module fixtures are set
+    up once. QUALITY_PARALLEL=0 runs the tests in a single process.
+    """
+    cmd = [str(venv_tool("pytest"))]
+    if parallel_enabled() and _xdist_available():
+        cmd += ["-n", "auto", "--dist=loadfile"]
+    return cmd
 
 
 def task_test() -> bool:
@@ -26,9 +47,7 @@ def task_test() -> bool:
     print_info("RUNNING TESTS")
     print_separator()
 
-    pytest = VENV_BIN / ("pytest.exe" if platform.system() == "Windows" else "pytest")
-
-    success, _ = run_command([str(pytest)], check=False)
+    success, _ = run_command(_pytest_command(), check=False)
     if success:
         print("\n" + "=" * 70)
         print_success("All tests passed!")
@@ -6,20 +6,164 @@ Synchronizes template files from python-quality-template to target projects.
 
 from __future__ import annotations
 
+import os
 import shutil
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-# Use the standard loader from utils (handles sys.path setup)
-from services import utils as utils_module
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+    from types import ModuleType
 
-utils = utils_module.load_service_utils()
+
+def _bootstrap_path() -> None:
+    """Make the `services` package importable when run as a standalone script."""
+    project_root = str(Path(__file__).resolve().parent.parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+
+
+def _load_modules() -> ModuleType:
+    """Load required modules; service.py already has the project root on sys.path."""
+    if __name__ == "__main__":
+        _bootstrap_path()
+    from services import utils
+    return utils
+
+
+utils = _load_modules()
 print_info = utils.print_info
 print_success = utils.print_success
 print_error = utils.print_error
 print_warning = utils.print_warning
 
 
+def _copy_file(src: str, dst: str, src_stat: os.stat_result | None = None) -> None:
+    """Copy file contents, permission bits and timestamps.
+
+    Lighter than `shutil.copy2`, which also copies extended attributes and flags;
+    the mtime is kept so `_copy_if_changed` can skip the file next time.
+    """
+    if src_stat is None:
+        src_stat = os.stat(src)
+    shutil.copyfile(src, dst)
+    os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+def _clone(src: str, dst: str, src_stat: os.stat_result | None = None) -> str:
+    """Copy a file with metadata, or hardlink it when TEMPLATE_SYNC_HARDLINK=1.
+
+    A hardlink skips copying the bytes, but the template and target then share
+    one inode, so an in-place edit in either project shows up in both. Falls
+    back to a copy when linking fails, e.g. across filesystems.
+    """
+    if utils.getenv("TEMPLATE_SYNC_HARDLINK") == "1":
+        tmp_path = f"{dst}.tmp-{os.getpid()}"
+        try:
+            os.link(src, tmp_path)
+            os.replace(tmp_path, dst)
+            return dst
+        except OSError:
+            with suppress(OSError):
+                os.unlink(tmp_path)
+    _copy_file(src, dst, src_stat)
+    return dst
+
+
+def _copy_if_changed(
+    src: str, dst: str, copied: list[str], unchanged: list[str] | None = None
+) -> str:
+    """Copy a file with metadata unless the destination has the same size and mtime.
+
+    Used as `copy_function` for `shutil.copytree`; copied paths are appended to
+    `copied` and, when given, skipped ones to `unchanged`.
+    """
+    src_stat = os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+    except OSError:
+        pass
+    else:
+        if src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+            if unchanged is not None:
+                unchanged.append(dst)
+            return dst
+    _clone(src, dst, src_stat)
+    copied.append(dst)
+    return dst
+
+
+# Copies wait on the filesystem, so run several at once
+SYNC_WORKERS = min(32, (os.cpu_count() or 2) * 4)
+
+
+def _submit_copy(
+    src: str,
+    dst: str,
+    executor: ThreadPoolExecutor,
+    futures: list[Future[str]],
+    copy: Callable[[str, str], str],
+) -> str:
+    """Queue a file copy on `executor`; used as `copy_function` for `shutil.copytree`.
+
+    copytree creates each directory before handing over its files, so the
+    copies can run while the walk continues.
+    """
+    futures.append(executor.submit(copy, src, dst))
+    return dst
+
+
+def _copytree_parallel(src: Path, dst: Path, copy: Callable[[str, str], str], **kwargs: Any) -> None:
+    """Run `shutil.copytree` with the file copies spread over a thread pool."""
+    futures: list[Future[str]] = []
+    with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as executor:
+        shutil.copytree(
+            src,
+            dst,
+            copy_function=partial(_submit_copy, executor=executor, futures=futures, copy=copy),
+            **kwargs,
+        )
+    # Re-raise the first copy error, as a serial copytree would
+    for future in futures:
+        future.result()
+
+
+def _remove_stale(template_dir: str, target_dir: str) -> None:
+    """Remove entries from target_dir that no longer exist in template_dir."""
+    with os.scandir(target_dir) as entries:
+        for entry in entries:
+            if entry.name == "__pycache__":
+                continue
+            source = os.path.join(template_dir, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if os.path.isdir(source):
+                    _remove_stale(source, entry.path)
+                else:
+                    shutil.rmtree(entry.path)
+            elif not os.path.exists(source):
+                os.unlink(entry.path)
+
+
+def _ignore_services(src: str, names: list[str], root: str) -> set[str]:
+    """Skip template.py, non-Python top-level files and bytecode caches."""
+    ignored = {"__pycache__"}
+    if src == root:
+        ignored.add("template.py")
+        ignored.update(
+            name
+            for name in names
+            if not name.endswith(".py") and os.path.isfile(os.path.join(src, name))
+        )
+    return ignored
+
+
 def sync_services(template_path: Path, target_path: Path) -> bool:
     """Sync services/* files from template to target project."""
     template_services = template_path / "services"
@@ -33,28 +177,26 @@ def sync_services(template_path: Path, target_path: Path) -> bool:
         target_services.mkdir(parents=True, exist_ok=True)
         print_info(f"Created services directory: {target_services}")
 
-    files_copied = 0
-    dirs_copied = 0
-
-    for item in template_services.iterdir():
-        if item.name == "template.py":
-            continue
-
-        target_item = target_services / item.name
-
-        if item.is_file():
-            if item.suffix == ".py" or item.name in ["__init__.py"]:
-                shutil.copy2(item, target_item)
-                files_copied += 1
-                print_info(f"Copied: {item.name}")
-        elif item.is_dir():
-            if target_item.exists():
-                shutil.rmtree(target_item)
-            shutil.copytree(item, target_item, dirs_exist_ok=True)
-            dirs_copied += 1
-            print_info(f"Copied directory: {item.name}/")
-
-    print_success(f"Synced services: {files_copied} files, {dirs_copied} directories")
+    copied: list[str] = []
+    _copytree_parallel(
+        template_services,
+        target_services,
+        partial(_copy_if_changed, copied=copied),
+        ignore=partial(_ignore_services, root=str(template_services)),
+        dirs_exist_ok=True,
+    )
+
+    # Subdirectories mirror the template, so drop files that were removed there
+    dirs_synced = 0
+    with os.scandir(template_services) as entries:
+        for entry in entries:
+            if entry.is_dir() and entry.name != "__pycache__":
+                _remove_stale(entry.path, str(target_services / entry.name))
+                dirs_synced += 1
+
+    for path in sorted(copied):
+        print_info(f"Copied: {Path(path).relative_to(target_services)}")
+    print_success(f"Synced services: {len(copied)} files updated, {dirs_synced} directories")
     return True
 
 
@@ -67,11 +209,12 @@ def sync_service_py(template_path: Path, target_path: Path) -> bool:
         print_error(f"Template service.py not found: {template_service}")
         return False
 
-    shutil.copy2(template_service, target_service)
+    _clone(str(template_service), str(target_service))
     print_success("Synced service.py")
     return True
 
 
+@lru_cache(maxsize=8)
 def _find_package_dir(base_path: Path) -> Path | None:
     """Find the package directory in src/.
 
@@ -82,15 +225,18 @@ def _find_package_dir(base_path: Path) -> Path | None:
         Path to package directory in src/, or None if not found
     """
     src_path = base_path / "src"
-    if not src_path.exists():
+    if not src_path.is_dir():
         return None
 
     # Find first directory in src/ that contains __init__.py
-    for item in src_path.iterdir():
-        if item.is_dir() and not item.name.startswith("_"):
-            init_file = item / "__init__.py"
-            if init_file.exists():
-                return item
+    with os.scandir(src_path) as entries:
+        for entry in entries:
+            if (
+                entry.is_dir()
+                and not entry.name.startswith("_")
+                and os.path.isfile(os.path.join(entry.path, "__init__.py"))
+            ):
+                return Path(entry.path)
 
     return None
 
@@ -116,37 +262,40 @@ def sync_cli(template_path: Path, target_path: Path) -> bool:
         print_warning("Target package directory not found in src/. Skipping CLI sync.")
         return True  # Not an error, just skip
 
-    files_copied = 0
-    dirs_copied = 0
-
-    # Sync cli.py
-    template_cli = template_package / "cli.py"
-    target_cli = target_package / "cli.py"
-    if template_cli.exists():
-        shutil.copy2(template_cli, target_cli)
-        files_copied += 1
-        print_info(f"Copied: {target_package.name}/cli.py")
-
-    # Sync __main__.py
-    template_main = template_package / "__main__.py"
-    target_main = target_package / "__main__.py"
-    if template_main.exists():
-        shutil.copy2(template_main, target_main)
-        files_copied += 1
-        print_info(f"Copied: {target_package.name}/__main__.py")
-
-    # Sync commands/ directory
+    dirs_synced = 0
+    copied: list[str] = []
+    unchanged: list[str] = []
+
+    # Sync cli.py and __main__.py
+    for name in ("cli.py", "__main__.py"):
+        template_file = template_package / name
+        if template_file.exists():
+            _copy_if_changed(str(template_file), str(target_package / name), copied, unchanged)
+
+    # Sync commands/ directory, leaving unchanged files in place
     template_commands = template_package / "commands"
     target_commands = target_package / "commands"
     if template_commands.exists() and template_commands.is_dir():
-        if target_commands.exists():
-            shutil.rmtree(target_commands)
-        shutil.copytree(template_commands, target_commands, dirs_exist_ok=True)
-        dirs_copied += 1
-        print_info(f"Copied directory: {target_package.name}/commands/")
-
-    if files_copied > 0 or dirs_copied > 0:
-        print_success(f"Synced CLI: {files_copied} files, {dirs_copied} directories")
+        if target_commands.is_file() or target_commands.is_symlink():
+            target_commands.unlink()
+        _copytree_parallel(
+            template_commands,
+            target_commands,
+            partial(_copy_if_changed, copied=copied, unchanged=unchanged),
+            ignore=shutil.ignore_patterns("__pycache__"),
+            dirs_exist_ok=True,
+        )
+        _remove_stale(str(template_commands), str(target_commands))
+        dirs_synced += 1
+
+    for path in sorted(copied):
+        print_info(f"Copied: {Path(path).relative_to(target_package.parent)}")
+
+    if copied or unchanged or dirs_synced:
+        print_success(
+            f"Synced CLI: {len(copied)} files updated, {len(unchanged)} unchanged, "
+            f"{dirs_synced} directories"
+        )
     else:
         print_info("No CLI files to sync (template may not have CLI structure yet)")
 
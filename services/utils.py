@@ -6,26 +6,64 @@ Contains common functions for printing, command execution, and result formatting
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-import platform
+import shutil
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import asdict, dataclass, fields
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Mapping, Sequence
+
+    Results = Mapping[str, "ToolResult | bool | Mapping[str, Any]"]
+
+IS_WINDOWS = sys.platform == "win32"
+EXE = ".exe" if IS_WINDOWS else ""
 
-# Load .env file if it exists
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
-_env_file = PROJECT_ROOT / ".env"
-if _env_file.exists():
+
+
+@lru_cache(maxsize=1)
+def _ensure_env_loaded() -> None:
+    """Load the project `.env` file into `os.environ`, once per process."""
+    env_file = PROJECT_ROOT / ".env"
+    if not env_file.exists():
+        return
     try:
         from dotenv import load_dotenv
-        load_dotenv(_env_file)
     except ImportError:
-        pass
+        return
+    load_dotenv(env_file)
+
+
+def getenv(name: str, default: str | None = None) -> str | None:
+    """Read an environment variable, loading the project `.env` file first.
+
+    Args:
+        name: Variable name
+        default: Value returned when the variable is not set
+
+    Returns:
+        The variable's value, or `default`
+    """
+    _ensure_env_loaded()
+    return os.environ.get(name, default)
 
 
 # ANSI color codes
@@ -37,38 +75,84 @@ CYAN = "\033[96m"
 MAGENTA = "\033[95m"
 NC = "\033[0m"  # No color
 
-if platform.system() == "Windows" and not os.environ.get("ANSICON"):
+if IS_WINDOWS and not os.environ.get("ANSICON"):
     BLUE = GREEN = RED = YELLOW = CYAN = MAGENTA = NC = ""
 
 
 def print_info(message: str) -> None:
     """Print an info message in blue."""
-    print(f"{BLUE}{message}{NC}")
+    sys.stdout.write(f"{BLUE}{message}{NC}\n")
 
 
 def print_success(message: str) -> None:
     """Print a success message in green."""
-    print(f"{GREEN}{message}{NC}")
+    sys.stdout.write(f"{GREEN}{message}{NC}\n")
 
 
 def print_error(message: str) -> None:
     """Print an error message in red to stderr."""
-    print(f"{RED}{message}{NC}", file=sys.stderr)
+    sys.stderr.write(f"{RED}{message}{NC}\n")
 
 
 def print_warning(message: str) -> None:
     """Print a warning message in yellow."""
-    print(f"{YELLOW}{message}{NC}")
+    sys.stdout.write(f"{YELLOW}{message}{NC}\n")
 
 
 def print_header(message: str) -> None:
     """Print a header message in cyan."""
-    print(f"{CYAN}{message}{NC}")
+    sys.stdout.write(f"{CYAN}{message}{NC}\n")
 
 
 def print_separator(char: str = "=", length: int = 70) -> None:
     """Print a separator line."""
-    print(char * length)
+    sys.stdout.write(char * length + "\n")
+
+
+class OutputBuffer:
+    """Collect output lines and write them to stdout in a single call.
+
+    Usable as a context manager; the buffer is flushed on exit.
+    """
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+
+    def __enter__(self) -> OutputBuffer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.flush()
+
+    def line(self, message: str = "") -> None:
+        """Add a plain line."""
+        self._lines.append(message)
+
+    def info(self, message: str) -> None:
+        """Add an info line in blue."""
+        self._lines.append(f"{BLUE}{message}{NC}")
+
+    def success(self, message: str) -> None:
+        """Add a success line in green."""
+        self._lines.append(f"{GREEN}{message}{NC}")
+
+    def warning(self, message: str) -> None:
+        """Add a warning line in yellow."""
+        self._lines.append(f"{YELLOW}{message}{NC}")
+
+    def header(self, message: str) -> None:
+        """Add a header line in cyan."""
+        self._lines.append(f"{CYAN}{message}{NC}")
+
+    def separator(self, char: str = "=", length: int = 70) -> None:
+        """Add a separator line."""
+        self._lines.append(char * length)
+
+    def flush(self) -> None:
+        """Write the buffered lines and clear the buffer."""
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
 
 
 def _resolve_venv_dir() -> Path:
@@ -82,20 +166,174 @@ def _resolve_venv_dir() -> Path:
 
 
 VENV_DIR = _resolve_venv_dir()
-VENV_BIN = VENV_DIR / ("Scripts" if platform.system() == "Windows" else "bin")
-PYTHON = VENV_BIN / ("python.exe" if platform.system() == "Windows" else "python")
-PIP = VENV_BIN / ("pip.exe" if platform.system() == "Windows" else "pip")
+VENV_BIN = VENV_DIR / ("Scripts" if IS_WINDOWS else "bin")
+PYTHON = VENV_BIN / f"python{EXE}"
+PIP = VENV_BIN / f"pip{EXE}"
+
+
+@cache
+def venv_tool(name: str) -> Path:
+    """Return the path of a console script installed in the virtual environment."""
+    return VENV_BIN / f"{name}{EXE}"
+
+
+def pip_no_compile_args() -> list[str]:
+    """Return pip arguments that skip .pyc compilation.
+
+    Editable installs skip compilation (bytecode is regenerated on import anyway).
+    Set DEV_NO_COMPILE=0 to restore pip's default behavior.
+    """
+    return ["--no-compile"] if getenv("DEV_NO_COMPILE", "1") != "0" else []
+
+
+def fast_editable() -> bool:
+    """Return True when FAST_EDITABLE=1 turns off build isolation for editable installs."""
+    return getenv("FAST_EDITABLE") == "1"
+
 
+def pip_editable_args() -> list[str]:
+    """Return pip arguments for editable installs.
 
+    With FAST_EDITABLE=1, build isolation is turned off so each editable
+    target is built with the backends already installed in the venv (see
+    `build_requirements`) instead of a fresh isolated environment per target.
+    """
+    args = pip_no_compile_args()
+    if fast_editable():
+        args.append("--no-build-isolation")
+    return args
+
+
+def build_requirements(project_dirs: Iterable[Path]) -> list[str]:
+    """Collect the `build-system.requires` entries of the given projects.
+
+    Projects without a readable `[build-system]` table get the PEP 517
+    default of setuptools and wheel.
+    """
+    requires: set[str] = set()
+    for project_dir in project_dirs:
+        build_system = None
+        if tomllib is not None:
+            try:
+                with (project_dir / "pyproject.toml").open("rb") as f:
+                    build_system = tomllib.load(f).get("build-system")
+            except (OSError, ValueError):
+                pass
+        if isinstance(build_system, dict) and isinstance(build_system.get("requires"), list):
+            requires.update(build_system["requires"])
+        else:
+            requires.update(("setuptools", "wheel"))
+    return sorted(requires)
+
+
+def pip_env() -> dict[str, str]:
+    """Return environment overrides for pip.
+
+    A shared download cache (so wheels fetched for one install are reused by
+    the next), no interactive prompts and no self-version check.
+    """
+    return {
+        "PIP_CACHE_DIR": getenv("PIP_CACHE_DIR") or str(PROJECT_ROOT / ".pip-cache"),
+        "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+        "PIP_NO_INPUT": "1",
+    }
+
+
+@lru_cache(maxsize=1)
 def venv_exists() -> bool:
-    """Check if virtual environment exists."""
+    """Check if virtual environment exists.
+
+    The result is cached per process; call `venv_exists.cache_clear()`
+    after creating or removing the virtual environment.
+    """
     return VENV_DIR.exists() and PYTHON.exists()
 
 
+def _unlink_quietly(path: str) -> None:
+    """Unlink a file, ignoring errors."""
+    with suppress(OSError):
+        os.unlink(path)
+
+
+def fast_rmtree(path: Path, max_workers: int | None = None) -> None:
+    """Remove a directory tree, unlinking files concurrently.
+
+    Large trees such as virtual environments are dominated by per-file unlink
+    syscalls, which overlap well across threads. Errors are ignored, like
+    `shutil.rmtree(path, ignore_errors=True)`, which is used directly on Windows.
+
+    Args:
+        path: Directory to remove
+        max_workers: Number of unlink threads; defaults to four per CPU, capped at 32
+    """
+    if IS_WINDOWS:
+        shutil.rmtree(path, ignore_errors=True)
+        return
+
+    files: list[str] = []
+    dirs: list[str] = []
+    stack = [str(path)]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with suppress(OSError), os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+
+    if max_workers is None:
+        # Unlinks wait on the filesystem, not the CPU, so oversubscribe
+        max_workers = min(32, (os.cpu_count() or 2) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_unlink_quietly, files))
+
+    # Parents were collected before their children, so reverse to remove leaves first
+    for directory in reversed(dirs):
+        with suppress(OSError):
+            os.rmdir(directory)
+
+    if os.path.lexists(path):
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _stream_output(
+    cmd: Sequence[str],
+    prefix: str,
+    env: Mapping[str, str] | None,
+    lines: list[str] | None = None,
+    **kwargs: Any,
+) -> int:
+    """Run a command, forwarding its merged stdout/stderr line by line.
+
+    Each line is written with `prefix` and, when `lines` is given, also collected there.
+    """
+    with subprocess.Popen(
+        cmd,
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        env=env,
+        **kwargs,
+    ) as proc:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            sys.stdout.write(f"{prefix}{line}")
+            if lines is not None:
+                lines.append(line)
+        return proc.wait()
+
+
 def run_command(
     cmd: Sequence[str],
     check: bool = True,
     capture_output: bool = False,
+    env: Mapping[str, str] | None = None,
+    prefix: str | None = None,
+    stream: bool = True,
     **kwargs: Any,
 ) -> tuple[bool, str | None]:
     """Run a command and return (success, output).
@@ -104,6 +342,11 @@ def run_command(
         cmd: Command to run
         check: If True, raise exception on non-zero exit
         capture_output: If True, capture and return stdout/stderr
+        env: Extra environment variables, merged over os.environ
+        prefix: If set, stream output live with each line prefixed, so
+            concurrent commands stay readable
+        stream: When capturing, still echo output live as it arrives; pass
+            False for silent capture
         **kwargs: Additional arguments for subprocess.run
 
     Returns:
@@ -111,14 +354,26 @@ def run_command(
     """
     printable = " ".join(cmd)
     print_info(f"Running: {printable}")
+    # Child tools (twine, gh, pip) read credentials from .env too
+    _ensure_env_loaded()
+    merged_env = {**os.environ, **env} if env else None
 
     try:
+        if prefix is not None or (capture_output and stream):
+            lines: list[str] | None = [] if capture_output else None
+            returncode = _stream_output(cmd, prefix or "", merged_env, lines, **kwargs)
+            output = "".join(lines) if lines is not None else None
+            if check and returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmd, output=output)
+            return (returncode == 0, output)
+
         result = subprocess.run(
             cmd,
             check=check,
             cwd=PROJECT_ROOT,
             capture_output=capture_output,
             text=True if capture_output else None,
+            env=merged_env,
             **kwargs,
         )
         output = result.stdout if capture_output else None
@@ -132,29 +387,295 @@ def run_command(
         return (False, None)
 
 
-def get_code_directories() -> list[str]:
-    """Get list of code directories to check.
+def run_captured(cmd: Sequence[str]) -> tuple[bool, str]:
+    """Run a command quietly, returning (success, combined stdout/stderr)."""
+    _ensure_env_loaded()
+    try:
+        result = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True, check=False)
+    except FileNotFoundError:
+        return (False, f"Command not found: {cmd[0]}\n")
+    return (result.returncode == 0, result.stdout + result.stderr)
+
+
+def parallel_enabled() -> bool:
+    """Return False when QUALITY_PARALLEL=0 asks for tools to run one at a time."""
+    return getenv("QUALITY_PARALLEL", "1") != "0"
+
+
+def run_commands_parallel(
+    commands: Mapping[str, Sequence[str]],
+    max_workers: int = 4,
+) -> dict[str, tuple[bool, str]]:
+    """Run independent commands concurrently.
+
+    Output is buffered per command so callers can print it in a fixed order
+    once everything has finished. Set QUALITY_PARALLEL=0 to run them one
+    after another instead, e.g. to tell which tool is slow or to debug one.
+
+    Args:
+        commands: Mapping of job name to command
+        max_workers: Maximum number of concurrent processes
+
+    Returns:
+        Mapping of job name to (success, combined stdout/stderr), in input order
+    """
+    if not commands:
+        return {}
+
+    if not parallel_enabled():
+        return {name: run_captured(cmd) for name, cmd in commands.items()}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(commands))) as executor:
+        futures = {name: executor.submit(run_captured, cmd) for name, cmd in commands.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
+@dataclass(slots=True)
+class ToolResult:
+    """Outcome of a single quality tool run."""
+
+    status: bool
+    errors: int = 0
+    warnings: int = 0
+    skipped: bool = False
+    details: str = ""
+
+    @classmethod
+    def coerce(cls, result: ToolResult | bool | Mapping[str, Any]) -> ToolResult:
+        """Accept the legacy bool and dict result forms."""
+        if isinstance(result, ToolResult):
+            return result
+        if isinstance(result, bool):
+            return cls(status=result)
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in result.items() if k in names})
+
+
+QUALITY_CONFIG_FILES = (
+    "pyproject.toml",
+    "setup.cfg",
+    "mypy.ini",
+    "ruff.toml",
+    ".pylintrc",
+    ".bandit",
+    ".semgrep.yaml",
+)
+
+QUALITY_CACHE_FILE = PROJECT_ROOT / ".cache" / "quality.json"
+FILE_HASH_CACHE_FILE = PROJECT_ROOT / ".cache" / "file-hashes.json"
+
+
+@lru_cache(maxsize=1)
+def _load_file_hashes() -> dict[str, list[Any]]:
+    """Load the per-file content hash memo once per process."""
+    try:
+        hashes: dict[str, list[Any]] = json.loads(FILE_HASH_CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return hashes
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """Write JSON to a temporary file and move it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        _unlink_quietly(tmp_path)
+        raise
+
+
+def _file_content_hash(path: str, hashes: dict[str, list[Any]]) -> tuple[str, bool]:
+    """Return a file's SHA-256, reusing the memo while its mtime and size match.
+
+    Returns:
+        Tuple of (hex digest, whether the memo was updated)
+    """
+    stat = os.stat(path)
+    entry = hashes.get(path)
+    if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        return (entry[2], False)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    hashes[path] = [stat.st_mtime_ns, stat.st_size, digest.hexdigest()]
+    return (hashes[path][2], True)
+
+
+def compute_source_fingerprint(targets: Sequence[str]) -> str:
+    """Fingerprint the Python sources under the targets.
+
+    Relative paths and file contents are hashed, so a fresh checkout or a
+    branch switch that only touches mtimes keeps the fingerprint. Content
+    hashes are memoized by mtime and size in `.cache/file-hashes.json`, so
+    unchanged files cost a stat rather than a read.
+
+    Args:
+        targets: Directories/files relative to `PROJECT_ROOT`
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    hashes = _load_file_hashes()
+    changed = False
+    digest = hashlib.sha256()
+
+    def add(path: str) -> None:
+        nonlocal changed
+        content_hash, updated = _file_content_hash(path, hashes)
+        changed = changed or updated
+        digest.update(f"{os.path.relpath(path, PROJECT_ROOT)}:{content_hash}\n".encode())
+
+    for target in targets:
+        target_path = PROJECT_ROOT / target
+        if target_path.is_file():
+            add(str(target_path))
+            continue
+        for root, dirs, files in os.walk(target_path):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__" and not d.startswith("."))
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    add(os.path.join(root, name))
+
+    if changed:
+        try:
+            _write_json_atomic(FILE_HASH_CACHE_FILE, hashes)
+        except OSError as e:
+            print_warning(f"Could not write file hash cache: {e}")
+    return digest.hexdigest()
+
+
+def tool_cache_key(cmd: Sequence[str], fingerprint: str) -> str:
+    """Build the cache key for one tool run.
+
+    The key covers the exact command, the tool executable (so upgrades
+    invalidate it), the tool configuration files and the source fingerprint.
+
+    Args:
+        cmd: Command that would be run
+        fingerprint: Result of `compute_source_fingerprint`
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256("\0".join(cmd).encode())
+    with suppress(OSError):
+        stat = os.stat(cmd[0])
+        digest.update(f"{stat.st_mtime_ns}:{stat.st_size}".encode())
+    for arg in cmd:
+        if arg.endswith((".yaml", ".yml")) and os.path.isfile(arg):
+            stat = os.stat(arg)
+            digest.update(f"{arg}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    for name in QUALITY_CONFIG_FILES:
+        config_file = PROJECT_ROOT / name
+        if config_file.is_file():
+            digest.update(name.encode())
+            digest.update(config_file.read_bytes())
+    digest.update(fingerprint.encode())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _load_quality_cache() -> dict[str, dict[str, Any]]:
+    """Load the quality cache file once per process."""
+    try:
+        cache: dict[str, dict[str, Any]] = json.loads(
+            QUALITY_CACHE_FILE.read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return {}
+    return cache
+
+
+def cache_lookup(tool: str, key: str) -> ToolResult | None:
+    """Return the cached passing result for a tool, if the key still matches.
+
+    Caching is disabled when `QUALITY_CACHE=0`.
+    """
+    if getenv("QUALITY_CACHE", "1") == "0":
+        return None
+    entry = _load_quality_cache().get(tool)
+    if entry and entry.get("key") == key:
+        return ToolResult.coerce(entry.get("result", {}))
+    return None
+
+
+def cache_store(tool: str, key: str, result: ToolResult) -> None:
+    """Record a passing tool result and write the cache file atomically."""
+    if getenv("QUALITY_CACHE", "1") == "0":
+        return
+    cache = _load_quality_cache()
+    cache[tool] = {"key": key, "result": asdict(result)}
+    try:
+        _write_json_atomic(QUALITY_CACHE_FILE, cache)
+    except OSError as e:
+        print_warning(f"Could not write quality cache: {e}")
+
+
+def parse_json_output(output: str) -> Any:
+    """Decode the JSON document at the start of a tool's output.
+
+    Tools often print progress to stderr after their JSON report, so any
+    trailing text is ignored.
+
+    Returns:
+        The decoded value, or None if the output does not start with JSON
+    """
+    try:
+        value, _ = json.JSONDecoder().raw_decode(output.lstrip())
+    except ValueError:
+        return None
+    return value
+
+
+def ensure_tool(path: str | Path) -> bool:
+    """Return True if the tool executable exists and can be run."""
+    return os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def skipped_result(label: str) -> ToolResult:
+    """Report a tool that is not installed and return its skipped result."""
+    print_warning(f"⚠ {label}: Not installed, skipping")
+    return ToolResult(status=True, skipped=True)
+
+
+def _is_package(entry: os.DirEntry[str]) -> bool:
+    """Return True for a public package directory, following symlinks."""
+    if entry.name.startswith((".", "_")):
+        return False
+    # DirEntry caches the type from the directory read
+    return entry.is_dir() and os.path.isfile(os.path.join(entry.path, "__init__.py"))
+
+
+@lru_cache(maxsize=1)
+def get_code_directories() -> tuple[str, ...]:
+    """Get the code directories to check.
 
     Returns relative paths from PROJECT_ROOT for better compatibility with tools.
+    The layout is fixed for a run, so the scan is cached; call
+    `get_code_directories.cache_clear()` after changing it.
     """
     code_dirs = []
     for potential_dir in ["src", "."]:
         path = PROJECT_ROOT / potential_dir
-        if path.exists():
-            # Find Python packages
-            for item in path.iterdir():
-                if (
-                    item.is_dir()
-                    and not item.name.startswith(".")
-                    and not item.name.startswith("_")
-                ):
-                    init_file = item / "__init__.py"
-                    if init_file.exists():
-                        # Return relative path from PROJECT_ROOT
-                        code_dirs.append(str(item.relative_to(PROJECT_ROOT)))
-            # If no packages found, use the directory itself if it has Python files
-            if not code_dirs and path != PROJECT_ROOT and any(path.glob("*.py")):
-                code_dirs.append(str(path.relative_to(PROJECT_ROOT)))
+        if not path.is_dir():
+            continue
+        # Find Python packages
+        has_modules = False
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if _is_package(entry):
+                    # Return relative path from PROJECT_ROOT
+                    code_dirs.append(os.path.relpath(entry.path, PROJECT_ROOT))
+                elif entry.name.endswith(".py"):
+                    has_modules = True
+        # If no packages found, use the directory itself if it has Python files
+        if not code_dirs and path != PROJECT_ROOT and has_modules:
+            code_dirs.append(potential_dir)
 
     # Also check for django_app_example at root level
     django_app = PROJECT_ROOT / "django_app_example"
@@ -165,12 +686,36 @@ def get_code_directories() -> list[str]:
     if not code_dirs:
         code_dirs = ["."]
 
-    return code_dirs
+    return tuple(code_dirs)
+
+
+SEMGREP_RULES_DIR = PROJECT_ROOT / ".cache" / "semgrep-rules"
+
+
+def vendored_semgrep_rules(config: str) -> Path:
+    """Return where a downloaded copy of a registry ruleset (e.g. `p/python`) is kept."""
+    return SEMGREP_RULES_DIR / f"{config.replace('/', '-')}.yaml"
+
+
+def semgrep_configs() -> list[str]:
+    """Return the Semgrep configs to scan with.
+
+    The local `.semgrep.yaml` (or `p/default` when absent) plus the Python and
+    supply-chain registry rulesets.
+    """
+    local_semgrep = PROJECT_ROOT / ".semgrep.yaml"
+    configs = [str(local_semgrep) if local_semgrep.exists() else "p/default"]
+    configs.extend(["p/python", "p/supply-chain"])
+    return configs
 
 
-def build_semgrep_command(semgrep: Path, targets: list[str]) -> list[str]:
+def build_semgrep_command(semgrep: Path, targets: Sequence[str]) -> list[str]:
     """Build semgrep command with appropriate configs.
 
+    Registry rulesets that were downloaded with `quality semgrep-rules` are
+    read from disk instead of being fetched on every scan. Files are
+    matched on one job per CPU, and usage metrics are not sent.
+
     Args:
         semgrep: Path to semgrep executable
         targets: List of target directories to scan
@@ -178,22 +723,18 @@ def build_semgrep_command(semgrep: Path, targets: list[str]) -> list[str]:
     Returns:
         Complete semgrep command as list of strings
     """
-    semgrep_cmd = [str(semgrep), "scan"]
-    semgrep_configs = []
-    local_semgrep = PROJECT_ROOT / ".semgrep.yaml"
-    if local_semgrep.exists():
-        semgrep_configs.append(str(local_semgrep))
-    else:
-        semgrep_configs.append("p/default")
-    semgrep_configs.extend(["p/python", "p/supply-chain"])
-    for config in semgrep_configs:
+    semgrep_cmd = [str(semgrep), "scan", "--jobs", str(os.cpu_count() or 4), "--metrics=off"]
+    for config in semgrep_configs():
+        local_rules = vendored_semgrep_rules(config)
+        if config.startswith("p/") and local_rules.is_file():
+            config = str(local_rules)
         semgrep_cmd += ["--config", config]
     semgrep_cmd += targets
     return semgrep_cmd
 
 
 def format_results_table(
-    results: dict[str, bool | dict[str, Any]],
+    results: Results,
     title: str | None = None,
     show_status: bool = True,
 ) -> str:
@@ -213,45 +754,42 @@ def format_results_table(
         lines.append("=" * 70)
 
     # Determine column widths
-    tool_width = max(len(str(k)) for k in results) + 2
-    if tool_width < 20:
-        tool_width = 20
-
+    tool_width = max(20, max(map(len, map(str, results))) + 2)
     status_width = 10 if show_status else 0
     details_width = 50
 
     # Header
-    header = f"{'Tool':<{tool_width}}"
+    header = "Tool".ljust(tool_width)
     if show_status:
-        header += f" {'Status':<{status_width}}"
-    header += f" {'Details':<{details_width}}"
+        header += " " + "Status".ljust(status_width)
+    header += " " + "Details".ljust(details_width)
     lines.append(header)
     lines.append("-" * 70)
 
     # Rows
-    for tool, result in results.items():
-        if isinstance(result, dict):
-            status = result.get("status", False)
-            details = result.get("details", "")
-            errors = result.get("errors", 0)
-            warnings = result.get("warnings", 0)
-            if errors or warnings:
-                details = f"Errors: {errors}, Warnings: {warnings}"
-        else:
-            status = bool(result)
-            details = ""
+    for tool, raw_result in results.items():
+        result = ToolResult.coerce(raw_result)
+        details = result.details
+        if result.errors or result.warnings:
+            details = f"Errors: {result.errors}, Warnings: {result.warnings}"
 
-        row = f"{tool:<{tool_width}}"
+        row = str(tool).ljust(tool_width)
         if show_status:
-            status_str = f"{GREEN}✓ PASS{NC}" if status else f"{RED}✗ FAIL{NC}"
-            row += f" {status_str:<{status_width + 9}}"  # +9 for ANSI codes
-        row += f" {details:<{details_width}}"
+            # Pad the visible text only, so alignment holds with or without ANSI codes
+            if result.skipped:
+                color, visible = YELLOW, "- SKIP"
+            elif result.status:
+                color, visible = GREEN, "✓ PASS"
+            else:
+                color, visible = RED, "✗ FAIL"
+            row += f" {color}{visible}{NC}{' ' * (status_width - len(visible))}"
+        row += " " + details.ljust(details_width)
         lines.append(row)
 
     return "\n".join(lines)
 
 
-def format_results_json(results: dict[str, bool | dict[str, Any]]) -> str:
+def format_results_json(results: Results) -> str:
     """Format results as JSON.
 
     Args:
@@ -260,19 +798,13 @@ def format_results_json(results: dict[str, bool | dict[str, Any]]) -> str:
     Returns:
         Formatted JSON string
     """
-    # Convert results to JSON-serializable format
-    json_results = {}
-    for tool, result in results.items():
-        if isinstance(result, dict):
-            json_results[tool] = result
-        else:
-            json_results[tool] = {"status": bool(result)}
+    json_results = {tool: asdict(ToolResult.coerce(result)) for tool, result in results.items()}
 
     return json.dumps(json_results, indent=2)
 
 
 def print_results(
-    results: dict[str, bool | dict[str, Any]],
+    results: Results,
     title: str | None = None,
     format: str = "table",
     show_status: bool = True,
@@ -287,13 +819,12 @@ def print_results(
     """
     if format.lower() == "json":
         output = format_results_json(results)
-        print(output)
     else:
         output = format_results_table(results, title=title, show_status=show_status)
-        print(output)
+    sys.stdout.write(output + "\n")
 
 
-def summarize_results(results: dict[str, bool | dict[str, Any]]) -> dict[str, Any]:
+def summarize_results(results: Results) -> dict[str, Any]:
     """Summarize results into statistics.
 
     Args:
@@ -305,27 +836,30 @@ def summarize_results(results: dict[str, bool | dict[str, Any]]) -> dict[str, An
     total = len(results)
     passed = 0
     failed = 0
+    skipped = 0
     total_errors = 0
     total_warnings = 0
 
-    for _tool, result in results.items():
-        if isinstance(result, dict):
-            status = result.get("status", False)
-            total_errors += result.get("errors", 0)
-            total_warnings += result.get("warnings", 0)
-        else:
-            status = bool(result)
+    for raw_result in results.values():
+        result = ToolResult.coerce(raw_result)
+        if result.skipped:
+            skipped += 1
+            continue
+        total_errors += result.errors
+        total_warnings += result.warnings
 
-        if status:
+        if result.status:
             passed += 1
         else:
             failed += 1
 
+    ran = total - skipped
     return {
         "total": total,
         "passed": passed,
         "failed": failed,
-        "success_rate": (passed / total * 100) if total > 0 else 0,
+        "skipped": skipped,
+        "success_rate": (passed / ran * 100) if ran > 0 else 0,
         "total_errors": total_errors,
         "total_warnings": total_warnings,
     }
@@ -337,18 +871,21 @@ def print_summary(summary: dict[str, Any]) -> None:
     Args:
         summary: Summary dictionary from summarize_results()
     """
-    print_separator()
-    print_header("Summary")
-    print_separator()
-    print(f"Total tools: {summary['total']}")
-    print(f"{GREEN}Passed: {summary['passed']}{NC}")
-    print(f"{RED}Failed: {summary['failed']}{NC}")
-    print(f"Success rate: {summary['success_rate']:.1f}%")
-    if summary.get("total_errors", 0) > 0:
-        print(f"{RED}Total errors: {summary['total_errors']}{NC}")
-    if summary.get("total_warnings", 0) > 0:
-        print(f"{YELLOW}Total warnings: {summary['total_warnings']}{NC}")
-    print_separator()
+    with OutputBuffer() as out:
+        out.separator()
+        out.header("Summary")
+        out.separator()
+        out.line(f"Total tools: {summary['total']}")
+        out.success(f"Passed: {summary['passed']}")
+        out.line(f"{RED}Failed: {summary['failed']}{NC}")
+        if summary.get("skipped", 0) > 0:
+            out.warning(f"Skipped: {summary['skipped']}")
+        out.line(f"Success rate: {summary['success_rate']:.1f}%")
+        if summary.get("total_errors", 0) > 0:
+            out.line(f"{RED}Total errors: {summary['total_errors']}{NC}")
+        if summary.get("total_warnings", 0) > 0:
+            out.warning(f"Total warnings: {summary['total_warnings']}")
+        out.separator()
 
 
 def load_service_utils() -> Any:
@@ -414,6 +951,39 @@ def check_venv_required() -> bool:
     return True
 
 
+def assume_yes() -> bool:
+    """Check whether DEV_ASSUME_YES=1 asks to answer yes to every confirmation."""
+    return getenv("DEV_ASSUME_YES") == "1"
+
+
+def confirm(prompt: str, default: bool = False, yes: bool = False) -> bool:
+    """Ask a yes/no question, without blocking in unattended runs.
+
+    Without a terminal on stdin (a pipe, CI) nobody can answer, so `default`
+    is used; only an explicit `--yes` or DEV_ASSUME_YES=1 answers yes.
+
+    Args:
+        prompt: Question displayed to the user
+        default: Answer used when the user just presses Enter or cannot be asked
+        yes: Answer yes without asking, as requested with `--yes`
+
+    Returns:
+        True if confirmed, False otherwise
+    """
+    if yes or assume_yes():
+        print_info(f"{prompt}y (assumed)")
+        return True
+
+    if not sys.stdin.isatty():
+        print_info(f"{prompt}{'y' if default else 'n'} (no terminal, using default)")
+        return default
+
+    response = input(prompt).strip().lower()
+    if not response:
+        return default
+    return response in ("y", "yes")
+
+
 def check_github_cli() -> bool:
     """Check if GitHub CLI (gh) is available.
 
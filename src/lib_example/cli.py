@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import importlib
+import os
 import sys
+from contextlib import suppress
+from functools import lru_cache
+from itertools import islice
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
+    from types import FrameType
 
     from .commands import CommandInfo
 
+# Discovered commands, keyed on (primary_package, additional_packages)
+_DISCOVERY_CACHE: dict[tuple[str | None, tuple[str, ...]], dict[str, CommandInfo]] = {}
+# Same key, commands sorted by name for the usage listing
+_SORTED_CACHE: dict[tuple[str | None, tuple[str, ...]], tuple[tuple[str, CommandInfo], ...]] = {}
 
+
+@lru_cache(maxsize=1)
 def _get_current_package_name() -> str:
     """Get the current package name (providerkit) dynamically.
 
@@ -30,12 +42,10 @@ def _detect_package_from_frames() -> str | None:
     Returns:
         Package name if found, None otherwise.
     """
-    from contextlib import suppress
-
     current_package = _get_current_package_name()
     with suppress(Exception):
-        import inspect
-        frame = inspect.currentframe()
+        # sys._getframe avoids importing inspect just for currentframe()
+        frame: FrameType | None = sys._getframe()
         for _ in range(10):
             if not frame:
                 break
@@ -48,6 +58,7 @@ def _detect_package_from_frames() -> str | None:
     return None
 
 
+@lru_cache(maxsize=1)
 def _get_package_name_from_context() -> str:
     """Get package name from current module context.
 
@@ -59,9 +70,8 @@ def _get_package_name_from_context() -> str:
     if __name__ and "." in __name__:
         return __name__.split(".")[0]
     try:
-        from pathlib import Path
         if __file__:
-            parent_dir = Path(__file__).parent.name
+            parent_dir = os.path.basename(os.path.dirname(__file__))
             if parent_dir and parent_dir != "cli.py":
                 return parent_dir
     except Exception:
@@ -88,6 +98,20 @@ def _get_package_name(package: str | None = None) -> str:
     return _get_package_name_from_context()
 
 
+def _import_command_modules(package: str, package_path: str) -> None:
+    """Import the modules of a commands package so they register themselves.
+
+    Args:
+        package: Dotted name of the commands package.
+        package_path: Directory of the commands package.
+    """
+    from .commands import _list_command_modules
+
+    for modname in _list_command_modules(package_path):
+        with suppress(ImportError):
+            importlib.import_module(f"{package}.{modname}")
+
+
 def _discover_commands_from_package(package_name: str) -> dict[str, CommandInfo]:
     """Discover commands from a specific package.
 
@@ -100,24 +124,16 @@ def _discover_commands_from_package(package_name: str) -> dict[str, CommandInfo]
     result: dict[str, CommandInfo] = {}
 
     try:
-        import importlib
-        import pkgutil
-        from contextlib import suppress
-        from pathlib import Path
-
         commands_module = importlib.import_module(f"{package_name}.commands")
 
         if hasattr(commands_module, "get_registered_commands"):
             for name, info in commands_module.get_registered_commands().items():
                 result[name] = {"func": info["func"], "description": info["description"]}
         elif hasattr(commands_module, "REGISTERED_COMMANDS"):
-            package_path = Path(commands_module.__file__).parent if commands_module.__file__ else Path()
-            allowed_modules = {f.stem for f in package_path.glob("*.py") if f.stem != "__init__"} if package_path.exists() else set()
-
-            for _, modname, ispkg in pkgutil.iter_modules([str(package_path)]):
-                if not ispkg and modname in allowed_modules:
-                    with suppress(Exception):
-                        importlib.import_module(f"{package_name}.commands.{modname}")
+            if commands_module.__file__:
+                _import_command_modules(
+                    f"{package_name}.commands", os.path.dirname(commands_module.__file__)
+                )
 
             if hasattr(commands_module, "_auto_discover_commands"):
                 commands_module._auto_discover_commands()
@@ -138,23 +154,11 @@ def _discover_current_package_commands() -> dict[str, CommandInfo]:
     """
     result: dict[str, CommandInfo] = {}
     try:
-        import importlib
-        import pkgutil
-        from contextlib import suppress
-        from pathlib import Path
-
         from . import commands
 
         package = commands.__package__
         if package:
-            package_path = Path(commands.__file__).parent if commands.__file__ else Path()
-            allowed_modules = {f.stem for f in package_path.glob("*.py") if f.stem != "__init__"} if package_path.exists() else set()
-
-            for _, modname, ispkg in pkgutil.iter_modules([str(package_path)]):
-                if not ispkg and modname in allowed_modules:
-                    with suppress(Exception):
-                        importlib.import_module(f"{package}.{modname}")
-
+            commands._auto_discover_commands()
             for name, info in commands.REGISTERED_COMMANDS.items():
                 result[name] = info
     except ImportError:
@@ -193,6 +197,11 @@ def _discover_commands(
     Returns:
         Dictionary mapping command names to their functions and descriptions.
     """
+    key = (primary_package, tuple(additional_packages or ()))
+    cached = _DISCOVERY_CACHE.get(key)
+    if cached is not None:
+        return cached.copy()
+
     result: dict[str, CommandInfo] = {}
 
     if primary_package is None:
@@ -204,7 +213,60 @@ def _discover_commands(
     if additional_packages:
         _merge_additional_commands(result, additional_packages)
 
-    return result
+    _DISCOVERY_CACHE[key] = result
+    return result.copy()
+
+
+def _sorted_commands(
+    primary_package: str | None = None,
+    additional_packages: list[str] | None = None,
+) -> tuple[tuple[str, CommandInfo], ...]:
+    """Return discovered commands as (name, info) pairs sorted by name.
+
+    Takes the same arguments as `_discover_commands`; the sort is done once per
+    set of packages.
+    """
+    key = (primary_package, tuple(additional_packages or ()))
+    cached = _SORTED_CACHE.get(key)
+    if cached is None:
+        commands = _discover_commands(primary_package, additional_packages)
+        cached = _SORTED_CACHE[key] = tuple(sorted(commands.items()))
+    return cached
+
+
+@lru_cache(maxsize=8)
+def _usage_text(
+    package_name: str,
+    primary_package: str | None = None,
+    additional_packages: tuple[str, ...] = (),
+) -> str:
+    """Build the usage message listing the discovered commands.
+
+    Args:
+        package_name: Program name shown in the usage lines.
+        primary_package: Passed to `_discover_commands`.
+        additional_packages: Passed to `_discover_commands`.
+
+    Returns:
+        The full message, ready to write in one call.
+    """
+    packages = list(additional_packages) or None
+    commands = _discover_commands(primary_package, packages)
+    lines = [f"Usage: {package_name} <command> [args...]", "", "Commands:"]
+    lines += [
+        f"  {cmd_name:<12} {cmd_info.get('description', '')}"
+        for cmd_name, cmd_info in _sorted_commands(primary_package, packages)
+    ]
+    lines += ["", "Examples:"]
+    lines += [f"  {package_name} {cmd_name}" for cmd_name in islice(commands, 3)]
+    return "\n".join(lines) + "\n"
+
+
+def _invalidate_discovery_cache() -> None:
+    """Forget discovered commands so the next lookup scans the packages again."""
+    _DISCOVERY_CACHE.clear()
+    _SORTED_CACHE.clear()
+    _usage_text.cache_clear()
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -213,18 +275,11 @@ def main(argv: Sequence[str] | None = None) -> int:
     commands = _discover_commands()
 
     if not args:
-        package_name = _get_package_name()
-        print(f"Usage: {package_name} <command> [args...]")
-        print("\nCommands:")
-        for cmd_name, cmd_info in sorted(commands.items()):
-            description = cmd_info["description"]
-            print(f"  {cmd_name:<12} {description}")
-        print("\nExamples:")
-        for cmd_name in list(commands.keys())[:3]:
-            print(f"  {package_name} {cmd_name}")
+        sys.stdout.write(_usage_text(_get_package_name()))
         return 1
 
-    command = args[0].lower()
+    # Registered names are interned, so the lookup can match on identity
+    command = sys.intern(args[0].lower())
 
     if command in commands:
         cmd_info = commands[command]
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import importlib
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, TypedDict
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
+    from types import ModuleType
 
 
 class CommandInfo(TypedDict):
@@ -16,6 +22,24 @@ class CommandInfo(TypedDict):
 
 # Registry for all commands - explicitly typed
 REGISTERED_COMMANDS: dict[str, CommandInfo] = {}
+_REGISTERED_VIEW = MappingProxyType(REGISTERED_COMMANDS)
+
+# Built-in commands: name -> (module, function, description). They are
+# registered up front and their modules imported only when the command runs;
+# any other module in this package is auto-discovered and registers itself.
+BUILTIN_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "example": (
+        "example",
+        "_example_command",
+        "Example command with argument handling (use --help for details)",
+    ),
+    "help": ("help", "_help_command", "Display available commands"),
+    "version": ("version", "_version_command", "Show version information"),
+}
+_BUILTIN_MODULES = frozenset(module for module, _, _ in BUILTIN_COMMANDS.values())
+
+# Set once the command modules have been imported
+_discovery_done = False
 
 
 def register_command(
@@ -33,6 +57,7 @@ def register_command(
     Raises:
         ValueError: If command name is already registered
     """
+    name = sys.intern(name)
     if name in REGISTERED_COMMANDS:
         raise ValueError(f"Command '{name}' is already registered")
 
@@ -42,40 +67,100 @@ def register_command(
     )
 
 
+@lru_cache(maxsize=32)
+def _scan_command_modules(package_path: str, mtime_ns: int) -> tuple[str, ...]:
+    """Scan a directory for command modules; `mtime_ns` keys the cache on its contents."""
+    del mtime_ns
+    # os.scandir rather than pkgutil.iter_modules, which imports inspect on first use
+    with os.scandir(package_path) as entries:
+        return tuple(
+            sorted(
+                entry.name[:-3]
+                for entry in entries
+                if entry.name.endswith(".py") and entry.name != "__init__.py" and entry.is_file()
+            )
+        )
+
+
+def _list_command_modules(package_path: str) -> tuple[str, ...]:
+    """Return the sorted module names in a commands directory, or () if it is missing.
+
+    Adding or removing a file changes the directory mtime, so the cached
+    listing is only reused while the directory is unchanged.
+    """
+    try:
+        return _scan_command_modules(package_path, os.stat(package_path).st_mtime_ns)
+    except OSError:
+        return ()
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a built-in command module on first attribute access (PEP 562).
+
+    The import binds the submodule on this package, so later lookups no longer
+    reach this function.
+    """
+    if name in _BUILTIN_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _lazy_command(module: str, attr: str) -> Callable[[list[str]], bool]:
+    """Return a command function that imports its implementation on first call."""
+
+    def run(args: list[str]) -> bool:
+        func: Callable[[list[str]], bool] = getattr(__getattr__(module), attr)
+        return func(args)
+
+    run.__name__ = attr
+    return run
+
+
+def _register_builtin_commands() -> None:
+    """Register the built-in commands without importing their modules."""
+    for name, (module, attr, description) in BUILTIN_COMMANDS.items():
+        register_command(name, _lazy_command(module, attr), description)
+
+
+_register_builtin_commands()
+
+
 # Auto-discover commands from this package
 def _auto_discover_commands() -> None:
-    """Automatically discover and register commands from command modules."""
+    """Automatically discover and register commands from command modules.
+
+    Runs once per process; later calls return immediately.
+    """
+    global _discovery_done
     package = __package__
-    if not package:
+    if _discovery_done or not package:
         return
 
-    # Get the package path
-    from pathlib import Path
-    package_path = Path(__file__).parent
+    # Import all other modules in this package. A module whose dependencies are
+    # missing is skipped; any other error in it is a bug and propagates
+    from contextlib import suppress
 
-    # Import all modules in this package
-    import importlib
-    import pkgutil
+    for modname in _list_command_modules(os.path.dirname(__file__)):
+        if modname in _BUILTIN_MODULES:
+            continue
+        with suppress(ImportError):
+            importlib.import_module(f"{package}.{modname}")
+            # Commands should register themselves on import
 
-    for _, modname, ispkg in pkgutil.iter_modules([str(package_path)]):
-        if not ispkg and modname != "__init__":
-            from contextlib import suppress
-            with suppress(Exception):
-                importlib.import_module(f"{package}.{modname}")
-                # Commands should register themselves on import
+    _discovery_done = True
 
 
 # Auto-discover on import
 _auto_discover_commands()
 
 
-def get_registered_commands() -> dict[str, CommandInfo]:
+def get_registered_commands() -> Mapping[str, CommandInfo]:
     """Get all registered commands.
 
     Returns:
-        Dictionary of command names to CommandInfo.
+        Read-only live view of command names to CommandInfo.
     """
     # Ensure commands are loaded
     _auto_discover_commands()
-    return REGISTERED_COMMANDS.copy()
+    return _REGISTERED_VIEW
 
@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
-from lib_example.commands import register_command
+_USAGE = "Usage: mypackage example [--name NAME] [--verbose]"
+
+# Flag -> (option, takes a value)
+_FLAGS: dict[str, tuple[str, bool]] = {
+    "--name": ("name", True),
+    "--verbose": ("verbose", False),
+    "-v": ("verbose", False),
+    "--help": ("help", False),
+    "-h": ("help", False),
+}
 
 
 def _example_command(args: list[str]) -> bool:
@@ -24,23 +33,23 @@ def _example_command(args: list[str]) -> bool:
     name = "World"
     verbose = False
 
-    # Simple argument parsing
+    # Simple argument parsing, one flag lookup per argument
     i = 0
     while i < len(args):
         arg = args[i]
-        if arg == "--name" and i + 1 < len(args):
-            name = args[i + 1]
-            i += 2
-        elif arg == "--verbose" or arg == "-v":
-            verbose = True
-            i += 1
-        elif arg == "--help" or arg == "-h":
-            print("Usage: mypackage example [--name NAME] [--verbose]")
+        option, takes_value = _FLAGS.get(arg, ("", False))
+        if option == "help":
+            print(_USAGE)
             return True
-        else:
+        if not option or (takes_value and i + 1 >= len(args)):
             print(f"Unknown argument: {arg}")
-            print("Usage: mypackage example [--name NAME] [--verbose]")
+            print(_USAGE)
             return False
+        if option == "name":
+            name = args[i + 1]
+        else:
+            verbose = True
+        i += 2 if takes_value else 1
 
     if verbose:
         print(f"Hello, {name}! (verbose mode)")
@@ -48,12 +57,3 @@ def _example_command(args: list[str]) -> bool:
         print(f"Hello, {name}!")
 
     return True
-
-
-# Auto-register on import - explicit and type-safe
-register_command(
-    "example",
-    _example_command,
-    "Example command with argument handling (use --help for details)",
-)
-
@@ -2,8 +2,33 @@
 
 from __future__ import annotations
 
+import importlib
+import sys
+from functools import lru_cache
+
 from ..cli import _get_current_package_name, _get_package_name  # noqa: TID252
-from ..commands import register_command  # noqa: TID252
+
+
+@lru_cache(maxsize=4)
+def _package_version(package_name: str) -> str:
+    """Return the version of a package, or 'unknown'.
+
+    A package that is already imported, which includes the one running this
+    CLI, reports its `__version__`. Otherwise the installed distribution
+    metadata is read so the package's code does not run; the package is only
+    imported when no distribution of that name is installed.
+    """
+    module = sys.modules.get(package_name)
+    if module is None:
+        from importlib.metadata import PackageNotFoundError
+        from importlib.metadata import version as dist_version
+
+        try:
+            return dist_version(package_name)
+        except PackageNotFoundError:
+            module = importlib.import_module(package_name)
+    version: str = getattr(module, "__version__", "unknown")
+    return version
 
 
 def _version_command(_args: list[str]) -> bool:
@@ -13,18 +38,10 @@ def _version_command(_args: list[str]) -> bool:
 
     if package_name != current_package:
         try:
-            package_module = __import__(package_name, fromlist=["__version__"])
-            version = getattr(package_module, "__version__", "unknown")
-            print(f"{package_name} version {version}")
+            print(f"{package_name} version {_package_version(package_name)}")
             return True
         except ImportError:
             pass
 
-    current_module = __import__(current_package, fromlist=["__version__"])
-    version = getattr(current_module, "__version__", "unknown")
-    print(f"{package_name} version {version}")
+    print(f"{package_name} version {_package_version(current_package)}")
     return True
-
-
-register_command("version", _version_command, "Show version information")
-
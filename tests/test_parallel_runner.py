@@ -0,0 +1,68 @@
+"""Tests for the parallel command runner used by the quality checks."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from services import utils
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+COMMANDS = {
+    "slow": [sys.executable, "-c", "import time; time.sleep(0.2); print('slow')"],
+    "fail": [sys.executable, "-c", "import sys; sys.stderr.write('bad\\n'); sys.exit(3)"],
+    "ok": [sys.executable, "-c", "print('ok')"],
+    "missing": ["no-such-quality-tool"],
+}
+
+EXPECTED = {
+    "slow": (True, "slow\n"),
+    "fail": (False, "bad\n"),
+    "ok": (True, "ok\n"),
+    "missing": (False, "Command not found: no-such-quality-tool\n"),
+}
+
+
+@pytest.mark.parametrize("parallel", ["1", "0"])
+def test_results_in_input_order(monkeypatch: pytest.MonkeyPatch, parallel: str) -> None:
+    monkeypatch.setenv("QUALITY_PARALLEL", parallel)
+
+    outputs = utils.run_commands_parallel(COMMANDS)
+
+    assert outputs == EXPECTED
+    assert list(outputs) == list(COMMANDS)
+
+
+def test_empty_commands() -> None:
+    assert utils.run_commands_parallel({}) == {}
+
+
+def test_commands_run_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("QUALITY_PARALLEL", raising=False)
+    # Every job waits for the others, so a sequential run breaks the barrier
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_run(cmd: Sequence[str]) -> tuple[bool, str]:
+        barrier.wait()
+        return (True, cmd[0])
+
+    monkeypatch.setattr(utils, "run_captured", fake_run)
+
+    outputs = utils.run_commands_parallel({"a": ["a"], "b": ["b"], "c": ["c"]})
+
+    assert outputs == {"a": (True, "a"), "b": (True, "b"), "c": (True, "c")}
+
+
+def test_worker_exception_reaches_caller(tmp_path: Path) -> None:
+    not_executable = tmp_path / "tool"
+    not_executable.write_text("#!/bin/sh\n", encoding="utf-8")
+    not_executable.chmod(0o644)
+
+    with pytest.raises(PermissionError):
+        utils.run_commands_parallel({"ok": COMMANDS["ok"], "tool": [str(not_executable)]})
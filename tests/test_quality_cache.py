@@ -0,0 +1,116 @@
+"""Tests for the quality result cache and the source fingerprint behind it."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from services import utils
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+CMD = ["ruff", "check", "pkg"]
+
+
+def _new_process() -> None:
+    """Drop the in-process copies of the cache files, as a fresh run would."""
+    utils._load_quality_cache.cache_clear()
+    utils._load_file_hashes.cache_clear()
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point the caches at a throwaway project holding one source file."""
+    monkeypatch.setattr(utils, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(utils, "QUALITY_CACHE_FILE", tmp_path / ".cache" / "quality.json")
+    monkeypatch.setattr(utils, "FILE_HASH_CACHE_FILE", tmp_path / ".cache" / "file-hashes.json")
+    monkeypatch.delenv("QUALITY_CACHE", raising=False)
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("x = 1\n", encoding="utf-8")
+    _new_process()
+    yield tmp_path
+    _new_process()
+
+
+def _key() -> str:
+    return utils.tool_cache_key(CMD, utils.compute_source_fingerprint(["pkg"]))
+
+
+@pytest.mark.usefixtures("project")
+def test_cache_hit_when_sources_unchanged() -> None:
+    result = utils.ToolResult(status=True, warnings=2)
+    utils.cache_store("ruff", _key(), result)
+    _new_process()
+
+    assert utils.cache_lookup("ruff", _key()) == result
+    assert utils.cache_lookup("mypy", _key()) is None
+
+
+def test_cache_miss_after_edit(project: Path) -> None:
+    utils.cache_store("ruff", _key(), utils.ToolResult(status=True))
+    _new_process()
+
+    (project / "pkg" / "mod.py").write_text("x = 100\n", encoding="utf-8")
+
+    assert utils.cache_lookup("ruff", _key()) is None
+
+
+def test_cache_miss_after_same_size_edit(project: Path) -> None:
+    source = project / "pkg" / "mod.py"
+    utils.cache_store("ruff", _key(), utils.ToolResult(status=True))
+    mtime_ns = source.stat().st_mtime_ns
+    _new_process()
+
+    source.write_text("x = 2\n", encoding="utf-8")
+    os.utime(source, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+    assert utils.cache_lookup("ruff", _key()) is None
+
+
+def test_cache_miss_after_new_file(project: Path) -> None:
+    utils.cache_store("ruff", _key(), utils.ToolResult(status=True))
+    _new_process()
+
+    (project / "pkg" / "other.py").write_text("y = 1\n", encoding="utf-8")
+
+    assert utils.cache_lookup("ruff", _key()) is None
+
+
+def test_cache_miss_after_config_change(project: Path) -> None:
+    utils.cache_store("ruff", _key(), utils.ToolResult(status=True))
+    _new_process()
+
+    (project / "pyproject.toml").write_text("[tool.ruff]\nline-length = 80\n", encoding="utf-8")
+
+    assert utils.cache_lookup("ruff", _key()) is None
+
+
+def test_touch_keeps_fingerprint(project: Path) -> None:
+    source = project / "pkg" / "mod.py"
+    before = utils.compute_source_fingerprint(["pkg"])
+    mtime_ns = source.stat().st_mtime_ns
+    os.utime(source, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    _new_process()
+
+    assert utils.compute_source_fingerprint(["pkg"]) == before
+
+
+@pytest.mark.usefixtures("project")
+def test_cache_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    utils.cache_store("ruff", _key(), utils.ToolResult(status=True))
+    _new_process()
+    monkeypatch.setenv("QUALITY_CACHE", "0")
+
+    assert utils.cache_lookup("ruff", _key()) is None
+
+
+@pytest.mark.usefixtures("project")
+def test_corrupt_cache_file_is_a_miss() -> None:
+    utils.QUALITY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    utils.QUALITY_CACHE_FILE.write_text("{not json", encoding="utf-8")
+
+    assert utils.cache_lookup("ruff", _key()) is None